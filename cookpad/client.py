@@ -35,6 +35,14 @@ from .types import (
     parse_users_response,
 )
 
+# Keep enough idle connections around for a day's worth of parallel searches,
+# and cap the total so a large gather can't open an unbounded number of sockets
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(limits=_HTTP_LIMITS)
+
 
 class Cookpad:
     """Cookpad API async client.
@@ -68,7 +76,7 @@ class Cookpad:
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> Cookpad:
-        self._client = httpx.AsyncClient()
+        self._client = _new_http_client()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
@@ -95,7 +103,7 @@ class Cookpad:
         self, path: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         if self._client is None:
-            self._client = httpx.AsyncClient()
+            self._client = _new_http_client()
 
         resp = await self._client.get(
             f"{BASE_URL}{path}", headers=self._headers(), params=params
@@ -114,6 +122,20 @@ class Cookpad:
 
         return resp.json()
 
+    async def warmup(self) -> None:
+        """Open a keep-alive connection to the API host ahead of real requests.
+
+        Lets concurrent requests reuse an established TLS connection instead
+        of racing to open their own. Failures are ignored; the next real
+        request reports them.
+        """
+        if self._client is None:
+            self._client = _new_http_client()
+        try:
+            await self._client.head(BASE_URL, headers=self._headers())
+        except httpx.HTTPError:
+            pass
+
     # --- Recipe search ---
 
     async def search_recipes(
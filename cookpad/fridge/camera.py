@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,6 +19,13 @@ class CameraCapture:
 class FridgeCamera:
     """Capture images from USB cameras attached to the fridge."""
 
+    # Indices that failed to open, mapped to when (time.monotonic()) they
+    # did. Probing a missing V4L2 device blocks for tens of ms, so repeated
+    # scans skip them, but only for _ABSENT_TTL seconds so that a camera
+    # plugged in later is still found.
+    _known_absent: dict[int, float] = {}
+    _ABSENT_TTL = 30.0
+
     def __init__(
         self, camera_indices: list[int] | None = None, save_dir: str = "/tmp/fridge"
     ) -> None:
@@ -70,8 +78,8 @@ class FridgeCamera:
         finally:
             cap.release()
 
-    @staticmethod
-    def list_cameras(max_check: int = 10) -> list[int]:
+    @classmethod
+    def list_cameras(cls, max_check: int = 10) -> list[int]:
         """List available USB camera indices by probing."""
         try:
             import cv2
@@ -80,10 +88,21 @@ class FridgeCamera:
                 "opencv-python is required: pip install opencv-python"
             ) from None
 
+        now = time.monotonic()
+        absent = {
+            i: seen
+            for i, seen in cls._known_absent.items()
+            if now - seen < cls._ABSENT_TTL
+        }
         available: list[int] = []
         for i in range(max_check):
+            if i in absent:
+                continue
             cap = cv2.VideoCapture(i)
             if cap.isOpened():
                 available.append(i)
                 cap.release()
+            else:
+                absent[i] = now
+        cls._known_absent = absent
         return available
@@ -14,6 +14,48 @@ if TYPE_CHECKING:
     from ..vision import DetectedIngredient
 
 
+# Status-filtered queries; the schema tests check each one is served by the
+# (status, expiration_date) index.
+_ACTIVE_INVENTORY_SQL = """SELECT * FROM food_inventory
+   WHERE status = 'active'
+   ORDER BY expiration_date"""
+
+_EXPIRING_SOON_SQL = """SELECT * FROM food_inventory
+   WHERE status = 'active'
+     AND expiration_date IS NOT NULL
+     AND expiration_date <= date(?, '+' || ? || ' days')
+   ORDER BY expiration_date"""
+
+_MARK_EXPIRED_SQL = """UPDATE food_inventory
+   SET status = 'expired',
+       updated_at = datetime('now', 'localtime')
+   WHERE status = 'active'
+     AND expiration_date IS NOT NULL
+     AND expiration_date < ?"""
+
+
+# RETURNING needs SQLite 3.35+.
+_INSERT_FOOD_SQL = """INSERT INTO food_inventory
+   (name, category, quantity, unit, purchase_date,
+    expiration_date, receipt_id, price, status)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'active')
+   RETURNING id"""
+
+
+def _food_row(item: FoodItem) -> tuple:
+    """Return the food_inventory column values for *item*."""
+    return (
+        item.name,
+        item.category,
+        item.quantity,
+        item.unit,
+        item.purchase_date,
+        item.estimated_expiry,
+        item.receipt_id,
+        item.price,
+    )
+
+
 class InventoryDB:
     """Manages the food_inventory table."""
 
@@ -37,49 +79,29 @@ class InventoryDB:
         Returns:
             List of inserted row IDs.
         """
+        if not items:
+            return []
         conn = self._get_conn()
-        ids: list[int] = []
-        for item in items:
-            cur = conn.execute(
-                """INSERT INTO food_inventory
-                   (name, category, quantity, unit, purchase_date,
-                    expiration_date, receipt_id, price, status)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'active')""",
-                (
-                    item.name,
-                    item.category,
-                    item.quantity,
-                    item.unit,
-                    item.purchase_date,
-                    item.estimated_expiry,
-                    item.receipt_id,
-                    item.price,
-                ),
-            )
-            ids.append(cur.lastrowid)
+        # One statement per row so RETURNING reports each row's real ID;
+        # the rows still share a single transaction and commit.
+        ids = [
+            conn.execute(_INSERT_FOOD_SQL, row).fetchone()[0]
+            for row in map(_food_row, items)
+        ]
         conn.commit()
         return ids
 
     def get_active_inventory(self) -> list[dict]:
         """Return all items with status='active'."""
         conn = self._get_conn()
-        rows = conn.execute(
-            "SELECT * FROM food_inventory WHERE status = 'active' ORDER BY expiration_date"
-        ).fetchall()
+        rows = conn.execute(_ACTIVE_INVENTORY_SQL).fetchall()
         return [dict(r) for r in rows]
 
     def get_expiring_soon(self, days: int = 3) -> list[dict]:
         """Return active items expiring within the given number of days."""
         conn = self._get_conn()
         target = date.today().isoformat()
-        rows = conn.execute(
-            """SELECT * FROM food_inventory
-               WHERE status = 'active'
-                 AND expiration_date IS NOT NULL
-                 AND expiration_date <= date(?, '+' || ? || ' days')
-               ORDER BY expiration_date""",
-            (target, days),
-        ).fetchall()
+        rows = conn.execute(_EXPIRING_SOON_SQL, (target, days)).fetchall()
         return [dict(r) for r in rows]
 
     def consume_item(self, item_id: int, amount: float = 1.0) -> None:
@@ -104,20 +126,15 @@ class InventoryDB:
     def mark_expired(self) -> int:
         """Set status='expired' for active items past their expiration_date.
 
+        Runs as one UPDATE over the (status, expiration_date) index, so no
+        rows are read back into Python.
+
         Returns:
             Number of rows updated.
         """
         conn = self._get_conn()
         today = date.today().isoformat()
-        cur = conn.execute(
-            """UPDATE food_inventory
-               SET status = 'expired',
-                   updated_at = datetime('now', 'localtime')
-               WHERE status = 'active'
-                 AND expiration_date IS NOT NULL
-                 AND expiration_date < ?""",
-            (today,),
-        )
+        cur = conn.execute(_MARK_EXPIRED_SQL, (today,))
         conn.commit()
         return cur.rowcount
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import sqlite3
 from pathlib import Path
 
-_SCHEMA_VERSION = 1
+_SCHEMA_VERSION = 2
 
 _DDL = """
 CREATE TABLE IF NOT EXISTS food_inventory (
@@ -25,7 +25,12 @@ CREATE TABLE IF NOT EXISTS food_inventory (
     updated_at TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
 );
 
-CREATE INDEX IF NOT EXISTS idx_inventory_status ON food_inventory(status);
+-- (status, expiration_date) serves both status filters and the nightly
+-- expiry UPDATE as a single index range scan; it supersedes the v1
+-- status-only index.
+DROP INDEX IF EXISTS idx_inventory_status;
+CREATE INDEX IF NOT EXISTS idx_inventory_status_expiration
+    ON food_inventory(status, expiration_date);
 CREATE INDEX IF NOT EXISTS idx_inventory_expiration ON food_inventory(expiration_date);
 CREATE INDEX IF NOT EXISTS idx_inventory_name ON food_inventory(name);
 
@@ -85,6 +90,12 @@ def ensure_schema(db_path: str | Path) -> sqlite3.Connection:
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
+    # Under WAL, NORMAL only fsyncs at checkpoints; a crash can lose the
+    # last commits but never corrupts the file, which is fine for inventory.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
     conn.execute("PRAGMA foreign_keys=ON")
 
     # Check current schema version
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import BinaryIO
 
 
 class GoogleDriveUploader:
@@ -98,21 +99,52 @@ class GoogleDriveUploader:
 
         from googleapiclient.http import MediaFileUpload
 
+        media = MediaFileUpload(
+            str(file_path),
+            mimetype="application/pdf",
+            resumable=True,
+        )
+        return self._create(media, filename or file_path.name, folder_id)
+
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        filename: str,
+        folder_id: str | None = None,
+    ) -> str:
+        """Upload an in-memory PDF to Google Drive.
+
+        Args:
+            fileobj: Binary file object positioned at the start of the data.
+            filename: Name for the file in Drive.
+            folder_id: Drive folder ID. Uses configured default if None.
+
+        Returns:
+            The Google Drive file ID of the uploaded file.
+
+        Raises:
+            ImportError: If required packages are not installed.
+        """
+        from googleapiclient.http import MediaIoBaseUpload
+
+        media = MediaIoBaseUpload(
+            fileobj,
+            mimetype="application/pdf",
+            resumable=False,
+        )
+        return self._create(media, filename, folder_id)
+
+    def _create(self, media, filename: str, folder_id: str | None) -> str:
+        """Create a Drive file from an upload body and return its ID."""
         service = self._get_service()
         target_folder = folder_id or self._folder_id
 
         file_metadata: dict = {
-            "name": filename or file_path.name,
+            "name": filename,
         }
         if target_folder:
             file_metadata["parents"] = [target_folder]
 
-        media = MediaFileUpload(
-            str(file_path),
-            mimetype="application/pdf",
-            resumable=True,
-        )
-
         result = (
             service.files()
             .create(body=file_metadata, media_body=media, fields="id")
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ReceiptEntry:
     """A single item line from an iAEON receipt."""
 
@@ -19,7 +19,7 @@ class ReceiptEntry:
     barcode: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FoodItem:
     """A normalized food item extracted from a receipt entry."""
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from datetime import date, timedelta
 
-from ..planner import _CATEGORY_KEYWORDS
+from ..planner import _guess_category
 from .auth import IAEONSession
 from .models import FoodItem, ReceiptEntry
 
@@ -27,6 +27,15 @@ _BRAND_PREFIXES: list[str] = [
     "TV　", "トップバリュ　", "BP　", "ベストプライス　",
 ]
 
+# Trailing quantity/weight labels and origin markers stripped from names
+_QUANTITY_SUFFIX_RE = re.compile(
+    r"\s*\d+(?:\.\d+)?(?:g|kg|ml|L|本入|個入|枚入|パック)\s*$"
+)
+_ORIGIN_LABEL_RE = re.compile(r"[^\s]*[都道府県産国内外]産\s*")
+
+# Leading YYYYMMDD of a compact purchased_at timestamp
+_DATE8_MATCH = re.compile(r"(\d{4})(\d{2})(\d{2})").match
+
 # Category-based expiry estimates (days from purchase)
 _EXPIRY_DAYS: dict[str, int] = {
     "肉": 3,
@@ -69,18 +78,14 @@ class ReceiptFetcher:
 
         access_token = self._session.access_token
 
-        # 1. Get receipt_account_id
-        temp_client = IAEONReceiptClient(
+        # 1. Get receipt_account_id on the same client (and HTTP session)
+        client = IAEONReceiptClient(
             access_token=access_token, receipt_account_id=""
         )
-        info = await asyncio.to_thread(temp_client.get_user_receipt_info)
-        receipt_account_id = info.get("receipt_account_id", "")
+        info = await asyncio.to_thread(client.get_user_receipt_info)
+        client.receipt_account_id = info.get("receipt_account_id", "")
 
-        # 2. Create authenticated receipt client
-        client = IAEONReceiptClient(
-            access_token=access_token,
-            receipt_account_id=receipt_account_id,
-        )
+        # 2. Authenticate the receipt client
         await asyncio.to_thread(client.auth_receipt)
 
         # 3. List receipts for date range (YYYYMMDD format)
@@ -100,12 +105,9 @@ class ReceiptFetcher:
 
             # purchased_at may be ISO datetime or compact YYYYMMDD...
             raw_dt = parsed.purchased_at or ""
-            if "T" in raw_dt:
-                purchase_date = raw_dt[:10]  # "2026-02-12T..." → "2026-02-12"
-            elif len(raw_dt) >= 8 and raw_dt[:8].isdigit():
-                purchase_date = f"{raw_dt[:4]}-{raw_dt[4:6]}-{raw_dt[6:8]}"
-            else:
-                purchase_date = raw_dt[:10]
+            # "2026-02-12T..." is sliced as-is; only compact dates are matched
+            m = None if "T" in raw_dt else _DATE8_MATCH(raw_dt)
+            purchase_date = f"{m[1]}-{m[2]}-{m[3]}" if m else raw_dt[:10]
 
             for product in parsed.products:
                 entries.append(
@@ -177,10 +179,10 @@ class ReceiptFetcher:
                 name = name[len(prefix):]
 
         # Remove quantity/weight suffixes like "300g", "2L", "6本入"
-        name = re.sub(r"\s*\d+(?:\.\d+)?(?:g|kg|ml|L|本入|個入|枚入|パック)\s*$", "", name)
+        name = _QUANTITY_SUFFIX_RE.sub("", name)
 
         # Remove origin labels like "北海道産", "国産", "〇〇県産"
-        name = re.sub(r"[^\s]*[都道府県産国内外]産\s*", "", name)
+        name = _ORIGIN_LABEL_RE.sub("", name)
 
         # Remove leading/trailing whitespace and special chars
         name = name.strip("　 ・/")
@@ -190,11 +192,7 @@ class ReceiptFetcher:
     @staticmethod
     def _guess_food_category(name: str) -> str:
         """Guess food category using the shared category keywords."""
-        for category, keywords in _CATEGORY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in name:
-                    return category
-        return "その他"
+        return _guess_category(name)
 
     @staticmethod
     def _estimate_expiry(name: str, category: str, purchase_date: str) -> str:
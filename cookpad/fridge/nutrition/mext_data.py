@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -41,11 +42,18 @@ class MEXTDatabase:
     _instance: MEXTDatabase | None = None
     _foods: list[NutrientInfo]
     _name_index: dict[str, NutrientInfo]
+    _id_index: dict[str, NutrientInfo]
 
     def __init__(self) -> None:
         self._foods = []
         self._name_index = {}
+        self._id_index = {}
         self._load()
+        # The table is immutable once loaded, so fuzzy lookups (which scan
+        # every food on a miss) can be memoized per instance.
+        self.lookup_by_name = functools.lru_cache(maxsize=1024)(
+            self._lookup_by_name
+        )
 
     @classmethod
     def instance(cls) -> MEXTDatabase:
@@ -56,6 +64,8 @@ class MEXTDatabase:
     @classmethod
     def reset(cls) -> None:
         """Reset the singleton (for testing)."""
+        if cls._instance is not None:
+            cls._instance.lookup_by_name.cache_clear()
         cls._instance = None
 
     def _load(self) -> None:
@@ -85,8 +95,9 @@ class MEXTDatabase:
             )
             self._foods.append(info)
             self._name_index[info.name] = info
+            self._id_index.setdefault(info.food_id, info)
 
-    def lookup_by_name(self, name: str) -> NutrientInfo | None:
+    def _lookup_by_name(self, name: str) -> NutrientInfo | None:
         """Look up nutrient info by food name.
 
         Tries exact match first, then substring match, then character-set
@@ -113,10 +124,7 @@ class MEXTDatabase:
 
     def lookup_by_id(self, food_id: str) -> NutrientInfo | None:
         """Look up by MEXT food ID."""
-        for food in self._foods:
-            if food.food_id == food_id:
-                return food
-        return None
+        return self._id_index.get(food_id)
 
     def search(self, query: str, limit: int = 10) -> list[NutrientInfo]:
         """Search foods by name substring."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from .planner import DailyMealPlan
 
@@ -46,30 +46,34 @@ def _find_japanese_font() -> str:
 
 
 def _register_japanese_font() -> str:
-    """Register a Japanese font with ReportLab and return the font name."""
+    """Register a Japanese font with ReportLab and return the font name.
+
+    Registration is process-wide, so the font file is only parsed once.
+    """
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
 
-    font_path = _find_japanese_font()
     font_name = "JapaneseFont"
-    pdfmetrics.registerFont(TTFont(font_name, font_path))
+    if font_name not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont(font_name, _find_japanese_font()))
     return font_name
 
 
 def generate_pdf(
     plan: DailyMealPlan,
-    output_path: str | Path,
+    output_path: str | Path | BinaryIO,
     daily_nutrition: DailyNutrition | None = None,
-) -> Path:
+) -> Path | BinaryIO:
     """Generate a PDF file from a DailyMealPlan.
 
     Args:
         plan: The meal plan to render.
-        output_path: Where to save the PDF file.
+        output_path: Where to save the PDF file, or a binary file object
+            (e.g. ``io.BytesIO``) to write it into.
         daily_nutrition: Optional nutrition data to include in the PDF.
 
     Returns:
-        Path to the generated PDF file.
+        Path to the generated PDF file, or the file object written to.
 
     Raises:
         ImportError: If reportlab is not installed.
@@ -93,11 +97,15 @@ def generate_pdf(
         )
 
     font_name = _register_japanese_font()
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(output_path, (str, Path)):
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        target = str(output_path)
+    else:
+        target = output_path
 
     doc = SimpleDocTemplate(
-        str(output_path),
+        target,
         pagesize=A4,
         leftMargin=15 * mm,
         rightMargin=15 * mm,
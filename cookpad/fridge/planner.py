@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import re
+import unicodedata
 from dataclasses import dataclass, field
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..client import Cookpad
-from ..types import Ingredient, Recipe
 from .vision import DetectedIngredient
 
 if TYPE_CHECKING:
+    from ..types import Recipe, SearchResponse
     from .iaeon.models import FoodItem
-    from .nutrition.calculator import DailyNutrition, NutritionTargets
+    from .nutrition.calculator import (
+        DailyNutrition,
+        MealNutrition,
+        NutritionTargets,
+    )
 
 _MEAL_TYPES = [
     ("breakfast", "朝食"),
@@ -21,6 +28,9 @@ _MEAL_TYPES = [
     ("dinner", "夕食"),
 ]
 
+# Partial day plans kept per slot by NutritionAwareMealPlanner
+_BEAM_WIDTH = 4
+
 # Query hints per meal type to steer recipe selection
 _MEAL_QUERIES: dict[str, list[str]] = {
     "breakfast": ["簡単 朝ごはん", "朝食", "トースト", "スープ"],
@@ -28,6 +38,10 @@ _MEAL_QUERIES: dict[str, list[str]] = {
     "dinner": ["晩ごはん", "メイン", "煮物", "定食"],
 }
 
+# Main dish search suffix per meal type (first query hint)
+_MEAL_MAIN_QUERY: dict[str, str] = {k: v[0] for k, v in _MEAL_QUERIES.items()}
+_DEFAULT_MAIN_QUERY = "レシピ"
+
 DEFAULT_STORAGE_LOCATIONS: dict[str, str] = {
     "野菜": "野菜室",
     "果物": "野菜室",
@@ -86,7 +100,7 @@ _CATEGORY_KEYWORDS: dict[str, list[str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnnotatedIngredient:
     """Recipe ingredient annotated with storage location and fridge availability."""
 
@@ -96,7 +110,7 @@ class AnnotatedIngredient:
     available_in_fridge: bool  # True if detected by vision
 
 
-@dataclass
+@dataclass(slots=True)
 class Meal:
     meal_type: str  # "breakfast" | "lunch" | "dinner"
     meal_type_ja: str  # "朝食" | "昼食" | "夕食"
@@ -108,147 +122,271 @@ class Meal:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyMealPlan:
     date: str
     detected_ingredients: list[str]
     meals: list[Meal] = field(default_factory=list)
+    _shopping: dict[str, AnnotatedIngredient] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed: tuple[Meal, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def add_meal(self, meal: Meal) -> None:
+        """Append a meal to the plan."""
+        self.meals.append(meal)
+
+    def _index_shopping(self, meal: Meal) -> None:
+        for ing in meal.main_dish_ingredients:
+            if not ing.available_in_fridge:
+                self._shopping.setdefault(ing.name, ing)
+        for side_ings in meal.side_dish_ingredients:
+            for ing in side_ings:
+                if not ing.available_in_fridge:
+                    self._shopping.setdefault(ing.name, ing)
 
     def shopping_list(self) -> list[AnnotatedIngredient]:
-        """Return deduplicated list of ingredients that need to be purchased."""
-        seen: set[str] = set()
-        result: list[AnnotatedIngredient] = []
-        for meal in self.meals:
-            for ing in meal.main_dish_ingredients:
-                if not ing.available_in_fridge and ing.name not in seen:
-                    seen.add(ing.name)
-                    result.append(ing)
-            for side_ings in meal.side_dish_ingredients:
-                for ing in side_ings:
-                    if not ing.available_in_fridge and ing.name not in seen:
-                        seen.add(ing.name)
-                        result.append(ing)
-        return result
+        """Return deduplicated list of ingredients that need to be purchased.
+
+        Only meals appended since the last call are indexed. If ``meals`` was
+        edited in any other way, the list is rebuilt from scratch.
+        """
+        indexed = self._indexed
+        if len(indexed) > len(self.meals) or any(
+            a is not b for a, b in zip(indexed, self.meals)
+        ):
+            self._shopping.clear()
+            indexed = ()
+        for meal in self.meals[len(indexed) :]:
+            self._index_shopping(meal)
+        self._indexed = tuple(self.meals)
+        return list(self._shopping.values())
 
     def display(self) -> str:
         """Format meal plan for terminal display."""
-        lines: list[str] = []
-        lines.append(f"📅 {self.date} の献立")
-        lines.append(f"🥬 検出食材: {', '.join(self.detected_ingredients)}")
-        lines.append("")
+        lines: list[str] = [
+            f"📅 {self.date} の献立",
+            f"🥬 検出食材: {', '.join(self.detected_ingredients)}",
+            "",
+        ]
 
         for meal in self.meals:
-            lines.append(f"{'─' * 50}")
-            lines.append(f"🍽  {meal.meal_type_ja}")
-            lines.append("")
+            main = meal.main_dish
+            lines += [_SECTION_RULE, f"🍽  {meal.meal_type_ja}", ""]
 
             # Main dish
-            lines.append(f"  【主菜】{meal.main_dish.title}")
-            if meal.main_dish.cooking_time:
-                lines.append(f"         調理時間: {meal.main_dish.cooking_time}")
-            if meal.main_dish.serving:
-                lines.append(f"         分量: {meal.main_dish.serving}")
-
-            # Main dish ingredients table
+            lines.append(f"  【主菜】{main.title}")
+            if main.cooking_time:
+                lines.append(f"         調理時間: {main.cooking_time}")
+            if main.serving:
+                lines.append(f"         分量: {main.serving}")
             if meal.main_dish_ingredients:
-                lines.append("")
-                lines.append(
-                    f"    {'食材名':<10} {'分量':<10} {'保存場所':<8} {'状態'}"
-                )
-                lines.append(f"    {'─' * 44}")
-                for ing in meal.main_dish_ingredients:
-                    status = (
-                        "✓ 冷蔵庫にあり" if ing.available_in_fridge else "要購入"
-                    )
-                    lines.append(
-                        f"    {ing.name:<10} {ing.quantity:<10} "
-                        f"{ing.storage_location:<8} {status}"
-                    )
-
-            # Main dish steps
-            if meal.main_dish.steps:
-                lines.append("")
-                lines.append("    手順:")
-                for j, step in enumerate(meal.main_dish.steps, 1):
-                    lines.append(f"      {j}. {step.description}")
+                lines += _ingredient_table(meal.main_dish_ingredients)
+            if main.steps:
+                lines += _step_lines(main)
 
             # Side dishes
             for i, side in enumerate(meal.side_dishes, 1):
-                lines.append("")
-                lines.append(f"  【副菜{i}】{side.title}")
+                lines += ["", f"  【副菜{i}】{side.title}"]
                 if side.cooking_time:
                     lines.append(f"         調理時間: {side.cooking_time}")
-
                 if i - 1 < len(meal.side_dish_ingredients):
                     side_ings = meal.side_dish_ingredients[i - 1]
                     if side_ings:
-                        lines.append("")
-                        lines.append(
-                            f"    {'食材名':<10} {'分量':<10} "
-                            f"{'保存場所':<8} {'状態'}"
-                        )
-                        lines.append(f"    {'─' * 44}")
-                        for ing in side_ings:
-                            status = (
-                                "✓ 冷蔵庫にあり"
-                                if ing.available_in_fridge
-                                else "要購入"
-                            )
-                            lines.append(
-                                f"    {ing.name:<10} {ing.quantity:<10} "
-                                f"{ing.storage_location:<8} {status}"
-                            )
-
+                        lines += _ingredient_table(side_ings)
                 if side.steps:
-                    lines.append("")
-                    lines.append("    手順:")
-                    for j, step in enumerate(side.steps, 1):
-                        lines.append(f"      {j}. {step.description}")
+                    lines += _step_lines(side)
 
             lines.append("")
 
         # Shopping list
         shopping = self.shopping_list()
         if shopping:
-            lines.append(f"{'─' * 50}")
-            lines.append("🛒 買い物リスト")
-            lines.append("")
-            lines.append(f"    {'食材名':<10} {'分量':<10} {'保存場所'}")
-            lines.append(f"    {'─' * 30}")
-            for ing in shopping:
-                lines.append(
-                    f"    {ing.name:<10} {ing.quantity:<10} {ing.storage_location}"
+            lines += [
+                _SECTION_RULE,
+                "🛒 買い物リスト",
+                "",
+                _SHOPPING_HEADER,
+                _SHOPPING_RULE,
+            ]
+            lines += [
+                _SHOPPING_ROW.format(
+                    name=_pad(ing.name, 10),
+                    quantity=_pad(ing.quantity, 10),
+                    storage_location=ing.storage_location,
                 )
+                for ing in shopping
+            ]
             lines.append("")
 
         return "\n".join(lines)
 
 
-def _guess_category(ingredient_name: str) -> str:
-    """Guess ingredient category from its name using keyword matching."""
-    for category, keywords in _CATEGORY_KEYWORDS.items():
+@functools.lru_cache(maxsize=1024)
+def _pad(text: str, width: int) -> str:
+    """Left-align text to a terminal column width.
+
+    Counts East Asian wide/fullwidth characters as two columns so that
+    tables mixing kana/kanji and ASCII line up.
+    """
+    used = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        used += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return text + " " * (width - used)
+
+
+# Templates for DailyMealPlan.display()
+_SECTION_RULE = "─" * 50
+_INGREDIENT_ROW = "    {name} {quantity} {storage_location} {status}"
+_INGREDIENT_HEADER = _INGREDIENT_ROW.format(
+    name=_pad("食材名", 10),
+    quantity=_pad("分量", 10),
+    storage_location=_pad("保存場所", 8),
+    status="状態",
+)
+_INGREDIENT_RULE = "    " + "─" * 44
+_SHOPPING_ROW = "    {name} {quantity} {storage_location}"
+_SHOPPING_HEADER = _SHOPPING_ROW.format(
+    name=_pad("食材名", 10), quantity=_pad("分量", 10), storage_location="保存場所"
+)
+_SHOPPING_RULE = "    " + "─" * 30
+_STATUS_LABELS = {True: "✓ 冷蔵庫にあり", False: "要購入"}
+
+
+def _ingredient_table(ingredients: list[AnnotatedIngredient]) -> list[str]:
+    """Render the ingredient table shown under each dish."""
+    return ["", _INGREDIENT_HEADER, _INGREDIENT_RULE] + [
+        _INGREDIENT_ROW.format(
+            name=_pad(ing.name, 10),
+            quantity=_pad(ing.quantity, 10),
+            storage_location=_pad(ing.storage_location, 8),
+            status=_STATUS_LABELS[bool(ing.available_in_fridge)],
+        )
+        for ing in ingredients
+    ]
+
+
+def _step_lines(recipe: Recipe) -> list[str]:
+    """Render the numbered cooking steps of a recipe."""
+    return ["", "    手順:"] + [
+        f"      {j}. {step.description}"
+        for j, step in enumerate(recipe.steps, 1)
+    ]
+
+
+# Marks a trie node that completes a keyword; maps to the category priority
+_TRIE_END = ""
+
+
+def _build_category_trie() -> tuple[list[str], dict]:
+    """Build a character trie over all category keywords.
+
+    Terminal nodes store the position of the keyword's category in
+    ``_CATEGORY_KEYWORDS`` so that lookups keep the declaration-order
+    priority of the original per-category scan.
+    """
+    categories = list(_CATEGORY_KEYWORDS)
+    trie: dict = {}
+    for priority, keywords in enumerate(_CATEGORY_KEYWORDS.values()):
         for keyword in keywords:
-            if keyword in ingredient_name:
-                return category
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node.setdefault(_TRIE_END, priority)
+    return categories, trie
+
+
+_CATEGORY_ORDER, _CATEGORY_TRIE = _build_category_trie()
+
+
+@functools.lru_cache(maxsize=4096)
+def _guess_category(ingredient_name: str) -> str:
+    """Guess ingredient category from its name using keyword matching.
+
+    Walks the keyword trie from each position of the name. When several
+    categories match, the one declared first in ``_CATEGORY_KEYWORDS`` wins.
+    """
+    best = len(_CATEGORY_ORDER)
+    for start in range(len(ingredient_name)):
+        node = _CATEGORY_TRIE
+        for char in ingredient_name[start:]:
+            node = node.get(char)
+            if node is None:
+                break
+            priority = node.get(_TRIE_END, best)
+            if priority < best:
+                best = priority
+                if best == 0:
+                    return _CATEGORY_ORDER[0]
+    if best < len(_CATEGORY_ORDER):
+        return _CATEGORY_ORDER[best]
     return "その他"
 
 
+@dataclass(slots=True, frozen=True)
+class _DetectedNames:
+    """Detected names compiled for repeated matching against recipe names."""
+
+    # One alternation over every detected name: finds "detected in name"
+    pattern: re.Pattern[str]
+    # Names joined by a separator absent from ingredient names: finds
+    # "name in detected" with a single substring test
+    joined: str
+    entries: list[tuple[str, frozenset[str]]]
+
+
+def _prepare_detected(detected_names: list[str]) -> _DetectedNames:
+    """Compile detected names once for repeated matching."""
+    # Longest first so the alternation prefers the most specific name
+    ordered = sorted(detected_names, key=len, reverse=True)
+    return _DetectedNames(
+        pattern=re.compile("|".join(map(re.escape, ordered))),
+        joined="\0".join(detected_names),
+        entries=[(detected, frozenset(detected)) for detected in detected_names],
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _prepare_detected_cached(detected_names: tuple[str, ...]) -> _DetectedNames:
+    """``_prepare_detected`` for the one-shot helpers, reused per name set."""
+    return _prepare_detected(list(detected_names))
+
+
+def _match_prepared(
+    name: str,
+    name_chars: frozenset[str],
+    detected: _DetectedNames,
+) -> bool:
+    """Match against detected names prepared by ``_prepare_detected``."""
+    if not detected.entries:
+        return False
+    # Direct substring match, in either direction
+    if detected.pattern.search(name) or name in detected.joined:
+        return True
+    for detected_name, detected_chars in detected.entries:
+        # Character-set containment: all chars of the shorter name
+        # appear in the longer name (handles 鶏肉 ↔ 鶏もも肉 etc.)
+        if len(detected_name) <= len(name):
+            if len(detected_name) >= 2 and detected_chars <= name_chars:
+                return True
+        elif len(name) >= 2 and name_chars <= detected_chars:
+            return True
+    return False
+
+
 def _match_ingredient(name: str, detected_names: list[str]) -> bool:
     """Check if an ingredient name matches any detected fridge ingredient.
 
     Uses substring matching plus character-set containment for Japanese
     ingredient names (e.g. "鶏肉" matches "鶏もも肉").
     """
-    for detected in detected_names:
-        # Direct substring match
-        if detected in name or name in detected:
-            return True
-        # Character-set containment: all chars of the shorter name
-        # appear in the longer name (handles 鶏肉 ↔ 鶏もも肉 etc.)
-        shorter, longer = (detected, name) if len(detected) <= len(name) else (name, detected)
-        if len(shorter) >= 2 and set(shorter).issubset(set(longer)):
-            return True
-    return False
+    return _match_prepared(
+        name, frozenset(name), _prepare_detected_cached(tuple(detected_names))
+    )
 
 
 def annotate_ingredients(
@@ -257,14 +395,26 @@ def annotate_ingredients(
     storage_locations: dict[str, str] | None = None,
 ) -> list[AnnotatedIngredient]:
     """Annotate recipe ingredients with storage locations and availability."""
-    locations = storage_locations or DEFAULT_STORAGE_LOCATIONS
+    return _annotate_prepared(
+        recipe,
+        _prepare_detected_cached(tuple(detected_names)),
+        storage_locations or DEFAULT_STORAGE_LOCATIONS,
+    )
+
+
+def _annotate_prepared(
+    recipe: Recipe,
+    detected: _DetectedNames,
+    locations: dict[str, str],
+) -> list[AnnotatedIngredient]:
+    """Annotate against detected names prepared by ``_prepare_detected``."""
     result: list[AnnotatedIngredient] = []
     for ing in recipe.ingredients:
         if ing.headline:
             continue
         category = _guess_category(ing.name)
         location = locations.get(category, "冷蔵室")
-        available = _match_ingredient(ing.name, detected_names)
+        available = _match_prepared(ing.name, frozenset(ing.name), detected)
         result.append(
             AnnotatedIngredient(
                 name=ing.name,
@@ -276,7 +426,37 @@ def annotate_ingredients(
     return result
 
 
-async def _enrich_recipe(client: Cookpad, recipe: Recipe) -> Recipe:
+class _CachedClient:
+    """Per-plan memo of Cookpad requests.
+
+    Identical searches and recipe fetches issued while building one plan
+    share a single request, whether it is still in flight or already done.
+    """
+
+    def __init__(self, client: Cookpad) -> None:
+        self._client = client
+        self._searches: dict[tuple, asyncio.Future[SearchResponse]] = {}
+        self._recipes: dict[int, asyncio.Future[Recipe]] = {}
+
+    async def search_recipes(self, query: str, **kwargs: Any) -> SearchResponse:
+        key = (query, *sorted(kwargs.items()))
+        future = self._searches.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._client.search_recipes(query, **kwargs)
+            )
+            self._searches[key] = future
+        return await future
+
+    async def get_recipe(self, recipe_id: int) -> Recipe:
+        future = self._recipes.get(recipe_id)
+        if future is None:
+            future = asyncio.ensure_future(self._client.get_recipe(recipe_id))
+            self._recipes[recipe_id] = future
+        return await future
+
+
+async def _enrich_recipe(client: Cookpad | _CachedClient, recipe: Recipe) -> Recipe:
     """Fetch full recipe detail if ingredients/steps are missing."""
     if recipe.ingredients and recipe.steps:
         return recipe
@@ -286,6 +466,63 @@ async def _enrich_recipe(client: Cookpad, recipe: Recipe) -> Recipe:
         return recipe
 
 
+async def _enrich_all(
+    client: Cookpad | _CachedClient, recipes: list[Recipe]
+) -> list[Recipe]:
+    """Enrich recipes in one batch, skipping those already complete."""
+    enriched = list(recipes)
+    needs = [i for i, r in enumerate(recipes) if not (r.ingredients and r.steps)]
+    fetched = await asyncio.gather(
+        *(_enrich_recipe(client, recipes[i]) for i in needs)
+    )
+    for i, recipe in zip(needs, fetched):
+        enriched[i] = recipe
+    return enriched
+
+
+_SIDE_SEARCH: dict[str, Any] = {"order": "popular", "per_page": 10}
+
+
+def _main_search(
+    ingredient_names: list[str], meal_type: str
+) -> tuple[str, dict[str, Any]]:
+    """Query and search options for a meal's primary main-dish search."""
+    main_query = _MEAL_MAIN_QUERY.get(meal_type, _DEFAULT_MAIN_QUERY)
+    query = f"{' '.join(ingredient_names[:2])} {main_query}"
+    return query, {
+        "order": "popular",
+        "per_page": 10,
+        "included_ingredients": ",".join(ingredient_names[:3]),
+    }
+
+
+def _side_query(ingredient_names: list[str]) -> str | None:
+    """Side-dish query built from the ingredients the main dish skips."""
+    excluded = set(ingredient_names[:2])
+    remaining = [n for n in ingredient_names if n not in excluded]
+    side_query_ingredients = remaining[:3] if remaining else ingredient_names[2:4]
+    if not side_query_ingredients:
+        return None
+    return f"{' '.join(side_query_ingredients[:2])} 副菜"
+
+
+def _reliable_names(ingredients: list[DetectedIngredient]) -> list[str]:
+    """Return names of confidently detected ingredients, most confident first."""
+    reliable = sorted(
+        [i for i in ingredients if i.confidence >= 0.5],
+        key=lambda x: x.confidence,
+        reverse=True,
+    )
+    ingredient_names = [i.name for i in reliable]
+
+    if not ingredient_names:
+        raise ValueError(
+            "信頼度の高い食材が検出されませんでした。"
+            "カメラの位置や照明を調整してみてください。"
+        )
+    return ingredient_names
+
+
 class MealPlanner:
     """Plan daily meals from detected fridge ingredients using Cookpad."""
 
@@ -304,32 +541,25 @@ class MealPlanner:
         meals_count: int = 3,
     ) -> DailyMealPlan:
         """Create a daily meal plan from detected ingredients."""
-        # Filter by confidence and sort
-        reliable = sorted(
-            [i for i in ingredients if i.confidence >= 0.5],
-            key=lambda x: x.confidence,
-            reverse=True,
-        )
-        ingredient_names = [i.name for i in reliable]
-
-        if not ingredient_names:
-            raise ValueError(
-                "信頼度の高い食材が検出されませんでした。"
-                "カメラの位置や照明を調整してみてください。"
-            )
+        ingredient_names = _reliable_names(ingredients)
 
         client = self._cookpad
         if client is None:
             client = Cookpad()
 
         try:
+            if self._owns_client:
+                await client.warmup()
+            cached = _CachedClient(client)
             used_recipe_ids: set[int] = set()
-            meals: list[Meal] = []
+            selected: list[tuple[str, str, Recipe, list[Recipe]]] = []
             meal_types = _MEAL_TYPES[:meals_count]
+            await self._prefetch_searches(cached, ingredient_names, meal_types)
 
+            # Picks stay sequential so later meals can exclude earlier ones
             for meal_type, meal_type_ja in meal_types:
                 main_dish, sides = await self._search_meal(
-                    client,
+                    cached,
                     ingredient_names,
                     meal_type,
                     used_recipe_ids,
@@ -338,119 +568,179 @@ class MealPlanner:
                     used_recipe_ids.add(main_dish.id)
                     for s in sides:
                         used_recipe_ids.add(s.id)
+                    selected.append((meal_type, meal_type_ja, main_dish, sides))
 
-                    # Enrich all recipes with full details in parallel
-                    enrich_tasks = [_enrich_recipe(client, main_dish)] + [
-                        _enrich_recipe(client, s) for s in sides
-                    ]
-                    enriched = await asyncio.gather(*enrich_tasks)
-                    main_dish = enriched[0]
-                    sides = list(enriched[1:])
-
-                    # Annotate ingredients
-                    main_ings = annotate_ingredients(
-                        main_dish, ingredient_names, self._storage_locations
-                    )
-                    side_ings = [
-                        annotate_ingredients(
-                            s, ingredient_names, self._storage_locations
-                        )
-                        for s in sides
-                    ]
-
-                    meals.append(
-                        Meal(
-                            meal_type=meal_type,
-                            meal_type_ja=meal_type_ja,
-                            main_dish=main_dish,
-                            side_dishes=sides,
-                            main_dish_ingredients=main_ings,
-                            side_dish_ingredients=side_ings,
-                        )
-                    )
+            return await self._build_plan(cached, ingredient_names, selected)
         finally:
             if self._owns_client and client is not None:
                 if client._client is not None:
                     await client._client.aclose()
 
-        return DailyMealPlan(
+    async def _build_plan(
+        self,
+        client: Cookpad | _CachedClient,
+        ingredient_names: list[str],
+        selected: list[tuple[str, str, Recipe, list[Recipe]]],
+    ) -> DailyMealPlan:
+        """Enrich and annotate the selected recipes into a DailyMealPlan."""
+        # Enrich every recipe of the day with full details in one batch
+        flat = [
+            recipe
+            for _, _, main_dish, sides in selected
+            for recipe in (main_dish, *sides)
+        ]
+        enriched = await _enrich_all(client, flat)
+
+        plan = DailyMealPlan(
             date=date.today().isoformat(),
             detected_ingredients=ingredient_names,
-            meals=meals,
         )
+        # Annotate each distinct recipe once against names compiled once
+        detected = _prepare_detected(ingredient_names)
+        locations = self._storage_locations or DEFAULT_STORAGE_LOCATIONS
+        annotations: dict[int, list[AnnotatedIngredient]] = {}
+
+        def annotate(recipe: Recipe) -> list[AnnotatedIngredient]:
+            result = annotations.get(recipe.id)
+            if result is None:
+                result = _annotate_prepared(recipe, detected, locations)
+                annotations[recipe.id] = result
+            return result
+
+        offset = 0
+        for meal_type, meal_type_ja, _, sides in selected:
+            main_dish = enriched[offset]
+            sides = list(enriched[offset + 1 : offset + 1 + len(sides)])
+            offset += 1 + len(sides)
+
+            main_ings = annotate(main_dish)
+            side_ings = [annotate(s) for s in sides]
+
+            plan.add_meal(
+                Meal(
+                    meal_type=meal_type,
+                    meal_type_ja=meal_type_ja,
+                    main_dish=main_dish,
+                    side_dishes=sides,
+                    main_dish_ingredients=main_ings,
+                    side_dish_ingredients=side_ings,
+                )
+            )
+        return plan
+
+    async def _prefetch_searches(
+        self,
+        client: _CachedClient,
+        ingredient_names: list[str],
+        meal_types: list[tuple[str, str]],
+    ) -> None:
+        """Issue every meal's primary searches concurrently.
+
+        The results land in the per-plan cache, so the sequential picks in
+        ``plan_daily`` await already-running requests instead of one
+        round-trip per meal. Failures surface again, and are handled, when
+        the picks await the same search.
+        """
+        searches = []
+        for meal_type, _ in meal_types:
+            query, kwargs = _main_search(ingredient_names, meal_type)
+            searches.append(client.search_recipes(query, **kwargs))
+        side_query = _side_query(ingredient_names)
+        if side_query is not None:
+            searches.append(client.search_recipes(side_query, **_SIDE_SEARCH))
+        await asyncio.gather(*searches, return_exceptions=True)
 
     async def _search_meal(
         self,
-        client: Cookpad,
+        client: Cookpad | _CachedClient,
         ingredient_names: list[str],
         meal_type: str,
         exclude_ids: set[int],
     ) -> tuple[Recipe | None, list[Recipe]]:
         """Search for a main dish + side dishes for one meal."""
-        queries = _MEAL_QUERIES.get(meal_type, ["レシピ"])
-        top_ingredients = ingredient_names[:5]
-        included = ",".join(top_ingredients[:3])
+        candidates = await self._search_main_candidates(
+            client, ingredient_names, meal_type, exclude_ids, limit=1
+        )
+        if not candidates:
+            return None, []
 
-        main_dish: Recipe | None = None
-        sides: list[Recipe] = []
+        main_dish = candidates[0]
+        sides = await self._search_sides(
+            client, ingredient_names, exclude_ids, main_dish.id
+        )
+        return main_dish, sides
+
+    async def _search_main_candidates(
+        self,
+        client: Cookpad | _CachedClient,
+        ingredient_names: list[str],
+        meal_type: str,
+        exclude_ids: set[int],
+        limit: int,
+    ) -> list[Recipe]:
+        """Search for up to ``limit`` main dish candidates for one meal."""
+        top3 = ingredient_names[:3]
+
+        candidates: list[Recipe] = []
+        # Track this call's picks separately instead of copying exclude_ids
+        picked: set[int] = set()
+
+        def collect(recipes: list[Recipe]) -> None:
+            for recipe in recipes:
+                if len(candidates) >= limit:
+                    return
+                if recipe.id not in exclude_ids and recipe.id not in picked:
+                    picked.add(recipe.id)
+                    candidates.append(recipe)
 
         # Search for main dish using top ingredients + meal query
-        query = f"{' '.join(top_ingredients[:2])} {queries[0]}"
         try:
-            result = await client.search_recipes(
-                query,
-                order="popular",
-                per_page=10,
-                included_ingredients=included,
-            )
-            for recipe in result.recipes:
-                if recipe.id not in exclude_ids:
-                    main_dish = recipe
-                    break
+            query, kwargs = _main_search(ingredient_names, meal_type)
+            result = await client.search_recipes(query, **kwargs)
+            collect(result.recipes)
         except Exception:
             pass
 
-        # If main search failed, try with just ingredient names
-        if main_dish is None:
+        # If the main search came up short, try with just ingredient names
+        if len(candidates) < limit:
             try:
                 result = await client.search_recipes(
-                    " ".join(top_ingredients[:3]),
+                    " ".join(top3),
                     order="popular",
                     per_page=10,
                 )
-                for recipe in result.recipes:
-                    if recipe.id not in exclude_ids:
-                        main_dish = recipe
-                        break
+                collect(result.recipes)
             except Exception:
                 pass
 
-        if main_dish is None:
-            return None, []
+        return candidates
 
-        # Search for side dishes using remaining ingredients
-        remaining = [n for n in ingredient_names if n not in top_ingredients[:2]]
-        side_query_ingredients = remaining[:3] if remaining else top_ingredients[2:4]
+    async def _search_sides(
+        self,
+        client: Cookpad | _CachedClient,
+        ingredient_names: list[str],
+        exclude_ids: set[int],
+        main_id: int,
+    ) -> list[Recipe]:
+        """Search for up to two side dishes using the remaining ingredients."""
+        side_query = _side_query(ingredient_names)
 
-        if side_query_ingredients:
-            side_query = f"{' '.join(side_query_ingredients[:2])} 副菜"
+        sides: list[Recipe] = []
+        if side_query is not None:
             try:
-                result = await client.search_recipes(
-                    side_query,
-                    order="popular",
-                    per_page=10,
-                )
-                exclude_now = exclude_ids | {main_dish.id}
+                result = await client.search_recipes(side_query, **_SIDE_SEARCH)
+                # Track new picks separately instead of copying exclude_ids
+                just_added = {main_id}
                 for recipe in result.recipes:
-                    if recipe.id not in exclude_now:
+                    if recipe.id not in exclude_ids and recipe.id not in just_added:
                         sides.append(recipe)
-                        exclude_now.add(recipe.id)
+                        just_added.add(recipe.id)
                         if len(sides) >= 2:
                             break
             except Exception:
                 pass
 
-        return main_dish, sides
+        return sides
 
 
 def food_items_to_ingredients(items: list[FoodItem]) -> list[DetectedIngredient]:
@@ -468,7 +758,7 @@ def food_items_to_ingredients(items: list[FoodItem]) -> list[DetectedIngredient]
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class NutritionDailyMealPlan(DailyMealPlan):
     """Extended DailyMealPlan with nutrition information."""
 
@@ -477,7 +767,8 @@ class NutritionDailyMealPlan(DailyMealPlan):
 
     def display(self) -> str:
         """Format meal plan with nutrition info for terminal display."""
-        base = super().display()
+        # Explicit base call: zero-argument super() breaks on slotted dataclasses
+        base = DailyMealPlan.display(self)
 
         if self.daily_nutrition is None:
             return base
@@ -488,7 +779,7 @@ class NutritionDailyMealPlan(DailyMealPlan):
         lines.append("栄養バランス")
         lines.append("")
         lines.append(
-            f"  {'栄養素':<10} {'摂取量':<10} {'目標':<10} {'達成率'}"
+            f"  {_pad('栄養素', 10)} {_pad('摂取量', 10)} {_pad('目標', 10)} 達成率"
         )
         lines.append(f"  {'─' * 44}")
 
@@ -516,7 +807,7 @@ class NutritionDailyMealPlan(DailyMealPlan):
 
         for name, actual, target, pct in rows:
             lines.append(
-                f"  {name:<10} {actual:<10} {target:<10} {pct:.0f}%"
+                f"  {_pad(name, 10)} {_pad(actual, 10)} {_pad(target, 10)} {pct:.0f}%"
             )
 
         lines.append("")
@@ -582,18 +873,80 @@ class NutritionAwareMealPlanner(MealPlanner):
         source = "iaeon" if food_items is not None else "camera"
         targets = self._nutrition_targets or NutritionTargets()
 
-        # Use the parent's plan_daily for the basic plan
-        plan = await self.plan_daily(ingredients, meals_count)
+        ingredient_names = _reliable_names(ingredients)
+        calculator = NutritionCalculator()
+
+        client = self._cookpad
+        if client is None:
+            client = Cookpad()
+
+        try:
+            if self._owns_client:
+                await client.warmup()
+            cached = _CachedClient(client)
+            meal_types = _MEAL_TYPES[:meals_count]
+
+            # Gather main dish candidates for every slot up front; slots do
+            # not exclude each other here, so the searches run concurrently
+            slot_candidates: list[list[Recipe]] = await asyncio.gather(
+                *(
+                    self._search_main_candidates(
+                        cached,
+                        ingredient_names,
+                        meal_type,
+                        set(),
+                        limit=candidate_count,
+                    )
+                    for meal_type, _ in meal_types
+                )
+            )
+
+            # Enrich each distinct candidate once, then score it once
+            unique = {r.id: r for slot in slot_candidates for r in slot}
+            enriched = await _enrich_all(cached, list(unique.values()))
+            recipes = {r.id: r for r in enriched}
+            nutrition = {
+                rid: calculator.calculate_recipe_nutrition(r)
+                for rid, r in recipes.items()
+            }
+
+            mains = _best_combination(
+                [[r.id for r in slot] for slot in slot_candidates],
+                nutrition,
+                targets,
+            )
+            # Mains are distinct; sides must avoid all of them
+            used_recipe_ids = {rid for rid in mains if rid is not None}
+            selected: list[tuple[str, str, Recipe, list[Recipe]]] = []
+            for (meal_type, meal_type_ja), main_id in zip(meal_types, mains):
+                if main_id is None:
+                    continue
+                sides = await self._search_sides(
+                    cached, ingredient_names, used_recipe_ids, main_id
+                )
+                used_recipe_ids.update(s.id for s in sides)
+                selected.append(
+                    (meal_type, meal_type_ja, recipes[main_id], sides)
+                )
+
+            plan = await self._build_plan(cached, ingredient_names, selected)
+        finally:
+            if self._owns_client and client is not None:
+                if client._client is not None:
+                    await client._client.aclose()
 
         # Calculate nutrition for all recipes in the plan
-        calculator = NutritionCalculator()
         all_recipes: list[Recipe] = []
         for meal in plan.meals:
             all_recipes.append(meal.main_dish)
             all_recipes.extend(meal.side_dishes)
 
-        daily_nutrition = calculator.calculate_daily_nutrition(
-            all_recipes, targets
+        daily_nutrition = DailyNutrition(
+            meals=[
+                nutrition.get(r.id) or calculator.calculate_recipe_nutrition(r)
+                for r in all_recipes
+            ],
+            targets=targets,
         )
 
         return NutritionDailyMealPlan(
@@ -603,3 +956,42 @@ class NutritionAwareMealPlanner(MealPlanner):
             daily_nutrition=daily_nutrition,
             source=source,
         )
+
+
+def _best_combination(
+    slots: list[list[int]],
+    nutrition: dict[int, MealNutrition],
+    targets: NutritionTargets,
+    beam_width: int = _BEAM_WIDTH,
+) -> list[int | None]:
+    """Pick one recipe ID per slot maximizing the day's PFC balance score.
+
+    Runs a beam search over the slots: each partial day is extended by every
+    unused candidate of the next slot, rescored from the precomputed
+    per-recipe nutrition, and only the ``beam_width`` best are kept.  Days
+    with more filled slots rank first.  Slots left unfilled yield ``None``.
+    """
+    from .nutrition.calculator import DailyNutrition
+
+    def score(ids: list[int | None]) -> tuple[int, float]:
+        meals = [nutrition[rid] for rid in ids if rid is not None]
+        return (
+            len(meals),
+            DailyNutrition(meals=meals, targets=targets).balance_score,
+        )
+
+    beams: list[tuple[tuple[int, float], list[int | None]]] = [((0, 0.0), [])]
+    for slot in slots:
+        expanded: list[tuple[tuple[int, float], list[int | None]]] = []
+        for key, ids in beams:
+            options = [rid for rid in slot if rid not in ids]
+            if not options:
+                expanded.append((key, [*ids, None]))
+                continue
+            for rid in options:
+                extended = [*ids, rid]
+                expanded.append((score(extended), extended))
+        expanded.sort(key=lambda beam: beam[0], reverse=True)
+        beams = expanded[:beam_width]
+
+    return beams[0][1]
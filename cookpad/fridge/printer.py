@@ -1,11 +1,53 @@
-"""Print PDF files using lpr."""
+"""Print PDF files via CUPS (pycups), falling back to lpr."""
 
 from __future__ import annotations
 
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable
+
+_local = threading.local()
+
+# Resolved once; the scheduler prints repeatedly from a long-lived process
+_LPR = shutil.which("lpr")
+_LPSTAT = shutil.which("lpstat")
+
+# Signature of subprocess.run, which the lpr/lpstat fallback calls
+Runner = Callable[..., "subprocess.CompletedProcess[str]"]
+
+
+def _cups_connection() -> Any | None:
+    """Return this thread's CUPS connection, or None if pycups is unusable.
+
+    The connection talks IPP to cupsd directly and is reused across calls
+    on the same thread, so no lpstat/lpr processes are spawned.
+    """
+    try:
+        import cups
+    except ImportError:
+        return None
+
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        try:
+            conn = cups.Connection()
+        except RuntimeError:
+            # cupsd not reachable
+            return None
+        _local.conn = conn
+    return conn
+
+
+def _drop_cups_connection() -> None:
+    """Forget this thread's CUPS connection so the next call reconnects.
+
+    Called after a failed request: a restarted cupsd leaves the cached
+    connection dead, and reusing it would fail forever.
+    """
+    _local.__dict__.pop("conn", None)
 
 
 @dataclass
@@ -15,31 +57,49 @@ class PrinterInfo:
 
 
 class Printer:
-    """Print files using the system lpr command."""
+    """Print files through CUPS, using pycups when installed and lpr otherwise."""
 
     @staticmethod
-    def list_printers() -> list[PrinterInfo]:
-        """List available printers using lpstat.
+    def list_printers(runner: Runner | None = None) -> list[PrinterInfo]:
+        """List available printers.
+
+        Args:
+            runner: Replacement for ``subprocess.run`` used to call lpstat.
+                Supplying one skips pycups and always uses lpstat.
 
         Returns:
             List of PrinterInfo with name and default status.
 
         Raises:
-            RuntimeError: If lpstat is not available.
+            RuntimeError: If neither pycups nor lpstat is available.
         """
-        if shutil.which("lpstat") is None:
+        conn = _cups_connection() if runner is None else None
+        if conn is not None:
+            try:
+                names = conn.getPrinters()
+                default_name = conn.getDefault()
+            except Exception:
+                _drop_cups_connection()
+            else:
+                return [
+                    PrinterInfo(name=name, is_default=(name == default_name))
+                    for name in names
+                ]
+
+        if _LPSTAT is None:
             raise RuntimeError(
                 "lpstat コマンドが見つかりません。"
                 "CUPS がインストールされているか確認してください:\n"
                 "  Ubuntu/Debian: sudo apt install cups\n"
                 "  Fedora/RHEL:   sudo dnf install cups"
             )
+        run = runner or subprocess.run
 
         # Get default printer
         default_name = ""
         try:
-            result = subprocess.run(
-                ["lpstat", "-d"],
+            result = run(
+                [_LPSTAT, "-d"],
                 capture_output=True,
                 text=True,
                 timeout=10,
@@ -53,8 +113,8 @@ class Printer:
         # List all printers
         printers: list[PrinterInfo] = []
         try:
-            result = subprocess.run(
-                ["lpstat", "-p"],
+            result = run(
+                [_LPSTAT, "-p"],
                 capture_output=True,
                 text=True,
                 timeout=10,
@@ -80,22 +140,30 @@ class Printer:
     def print_file(
         file_path: str | Path,
         printer_name: str | None = None,
+        runner: Runner | None = None,
     ) -> None:
-        """Print a file using lpr.
+        """Print a file.
 
         Args:
             file_path: Path to the file to print.
             printer_name: Specific printer name. Uses default if None.
+            runner: Replacement for ``subprocess.run`` used to call lpr.
+                Supplying one skips pycups and always uses lpr.
 
         Raises:
             FileNotFoundError: If the file doesn't exist.
-            RuntimeError: If lpr is not available or printing fails.
+            RuntimeError: If no print backend is available or printing fails.
         """
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
 
-        if shutil.which("lpr") is None:
+        conn = _cups_connection() if runner is None else None
+        if conn is not None:
+            _print_with_cups(conn, file_path, printer_name)
+            return
+
+        if _LPR is None:
             raise RuntimeError(
                 "lpr コマンドが見つかりません。"
                 "CUPS がインストールされているか確認してください:\n"
@@ -103,13 +171,13 @@ class Printer:
                 "  Fedora/RHEL:   sudo dnf install cups"
             )
 
-        cmd = ["lpr"]
+        cmd = [_LPR]
         if printer_name:
             cmd.extend(["-P", printer_name])
         cmd.append(str(file_path))
 
         try:
-            result = subprocess.run(
+            result = (runner or subprocess.run)(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -121,3 +189,16 @@ class Printer:
                 )
         except subprocess.TimeoutExpired:
             raise RuntimeError("印刷ジョブがタイムアウトしました。")
+
+
+def _print_with_cups(conn: Any, file_path: Path, printer_name: str | None) -> None:
+    """Submit a print job over an open CUPS connection."""
+    try:
+        destination = printer_name or conn.getDefault()
+        if destination:
+            conn.printFile(destination, str(file_path), "cookpad", {})
+    except Exception as e:
+        _drop_cups_connection()
+        raise RuntimeError(f"印刷に失敗しました: {e}") from e
+    if not destination:
+        raise RuntimeError("印刷に失敗しました: デフォルトのプリンタが設定されていません")
@@ -3,14 +3,66 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import io
 import json
 import logging
-import tempfile
 from datetime import date
-from pathlib import Path
+
+from ..client import Cookpad
+from .db import InventoryDB, MealHistoryDB
+from .gdrive import GoogleDriveUploader
+from .iaeon import IAEONAuthenticator, ReceiptFetcher
+from .nutrition.calculator import NutritionTargets
+from .pdf import generate_pdf
+from .planner import NutritionAwareMealPlanner
 
 logger = logging.getLogger(__name__)
 
+# Plan jobs firing this many minutes after a receipt fetch are merged into
+# one run.
+_COALESCE_WINDOW_MINUTES = 5
+
+
+@functools.lru_cache(maxsize=32)
+def _cron_trigger(expr: str):
+    """Build a CronTrigger for a 5-field cron expression.
+
+    Triggers are immutable once built, so reloading jobs with the same
+    schedule reuses the instance instead of re-validating every field.
+    """
+    from apscheduler.triggers.cron import CronTrigger
+
+    parts = expr.split()
+    if len(parts) == 5:
+        return CronTrigger(
+            minute=parts[0],
+            hour=parts[1],
+            day=parts[2],
+            month=parts[3],
+            day_of_week=parts[4],
+        )
+    raise ValueError(f"無効なcron式: {expr}")
+
+
+def _fires_shortly_after(first: str, second: str) -> bool:
+    """Return True if cron *second* fires just after every firing of *first*.
+
+    Only schedules with the same cadence qualify: the hour, day, month and
+    day-of-week fields must be identical and both minutes fixed, with
+    *second* at most ``_COALESCE_WINDOW_MINUTES`` later. Anything else
+    (e.g. a fetch every 6 hours and a daily plan) is not one-to-one, so the
+    jobs must stay separate. The answer depends only on the expressions,
+    not on when it is asked.
+    """
+    first_fields, second_fields = first.split(), second.split()
+    if len(first_fields) != 5 or first_fields[1:] != second_fields[1:]:
+        return False
+    first_minute, second_minute = first_fields[0], second_fields[0]
+    if not (first_minute.isdigit() and second_minute.isdigit()):
+        return False
+    return 0 <= int(second_minute) - int(first_minute) <= _COALESCE_WINDOW_MINUTES
+
 
 class MealPlanScheduler:
     """Manages scheduled jobs for receipt fetching and meal plan generation.
@@ -29,7 +81,6 @@ class MealPlanScheduler:
         """
         try:
             from apscheduler.schedulers.asyncio import AsyncIOScheduler
-            from apscheduler.triggers.cron import CronTrigger
         except ImportError:
             raise ImportError(
                 "apscheduler が必要です: pip install 'cookpad[scheduler]'"
@@ -37,40 +88,63 @@ class MealPlanScheduler:
 
         self._config = config
         self._scheduler = AsyncIOScheduler()
-        self._CronTrigger = CronTrigger
+        # Long-lived handles; each connects on first use and stays open until
+        # stop(). Jobs run on the event loop thread and never await between
+        # DB calls, so the connections are not shared across threads.
+        self._inventory_db = InventoryDB(config.database.path)
+        self._history_db = MealHistoryDB(config.database.path)
+        # Held while receipts are fetched; a separately scheduled plan waits
+        # on it so it never runs against a half-updated inventory.
+        self._fetch_lock = asyncio.Lock()
         self._running = False
 
     def setup_jobs(self) -> None:
         """Register scheduled jobs based on config."""
         # Job 1: Fetch receipts from iAEON
-        if self._config.iaeon.enabled:
-            trigger = self._parse_cron(self._config.iaeon.fetch_schedule)
-            self._scheduler.add_job(
-                self._job_fetch_receipts,
-                trigger=trigger,
-                id="fetch_receipts",
-                name="iAEONレシート取得",
-                replace_existing=True,
-            )
-            logger.info(
-                "レシート取得ジョブ登録: %s",
-                self._config.iaeon.fetch_schedule,
-            )
-
         # Job 2: Generate nutrition-balanced meal plan
         if self._config.iaeon.enabled:
-            trigger = self._parse_cron(self._config.iaeon.plan_schedule)
-            self._scheduler.add_job(
-                self._job_generate_plan,
-                trigger=trigger,
-                id="generate_plan",
-                name="栄養バランス献立生成",
-                replace_existing=True,
-            )
-            logger.info(
-                "献立生成ジョブ登録: %s",
-                self._config.iaeon.plan_schedule,
-            )
+            fetch_trigger = self._parse_cron(self._config.iaeon.fetch_schedule)
+            plan_trigger = self._parse_cron(self._config.iaeon.plan_schedule)
+
+            if _fires_shortly_after(
+                self._config.iaeon.fetch_schedule, self._config.iaeon.plan_schedule
+            ):
+                # Back-to-back schedules: run both bodies in one wake-up
+                # so the plan always sees the freshly fetched inventory.
+                self._scheduler.add_job(
+                    self._job_fetch_then_plan,
+                    trigger=plan_trigger,
+                    id="fetch_then_plan",
+                    name="iAEONレシート取得+献立生成",
+                    replace_existing=True,
+                )
+                logger.info(
+                    "レシート取得+献立生成ジョブ登録: %s",
+                    self._config.iaeon.plan_schedule,
+                )
+            else:
+                self._scheduler.add_job(
+                    self._job_fetch_receipts,
+                    trigger=fetch_trigger,
+                    id="fetch_receipts",
+                    name="iAEONレシート取得",
+                    replace_existing=True,
+                )
+                logger.info(
+                    "レシート取得ジョブ登録: %s",
+                    self._config.iaeon.fetch_schedule,
+                )
+                self._scheduler.add_job(
+                    self._job_generate_plan,
+                    trigger=plan_trigger,
+                    id="generate_plan",
+                    name="栄養バランス献立生成",
+                    replace_existing=True,
+                )
+                logger.info(
+                    "献立生成ジョブ登録: %s",
+                    self._config.iaeon.plan_schedule,
+                )
 
         # Job 3: Expire old items (daily at midnight)
         trigger = self._parse_cron("0 0 * * *")
@@ -96,6 +170,8 @@ class MealPlanScheduler:
             self._scheduler.shutdown(wait=False)
             self._running = False
             logger.info("スケジューラー停止")
+        self._inventory_db.close()
+        self._history_db.close()
 
     @property
     def running(self) -> bool:
@@ -114,67 +190,47 @@ class MealPlanScheduler:
 
     def _parse_cron(self, expr: str):
         """Parse a cron expression into a CronTrigger."""
-        parts = expr.split()
-        if len(parts) == 5:
-            return self._CronTrigger(
-                minute=parts[0],
-                hour=parts[1],
-                day=parts[2],
-                month=parts[3],
-                day_of_week=parts[4],
-            )
-        raise ValueError(f"無効なcron式: {expr}")
+        return _cron_trigger(expr)
 
     async def _job_fetch_receipts(self) -> None:
         """Fetch recent receipts and add food items to inventory."""
         logger.info("レシート取得ジョブ実行中...")
 
-        try:
-            from .db import InventoryDB
-            from .iaeon import IAEONAuthenticator, ReceiptFetcher
-
-            # Authenticate
-            auth = IAEONAuthenticator(
-                phone=self._config.iaeon.phone,
-                password=self._config.iaeon.password,
-                otp_method=self._config.iaeon.otp_method,
-            )
-            session = await auth.login()
+        async with self._fetch_lock:
+            try:
+                # Authenticate
+                auth = IAEONAuthenticator(
+                    phone=self._config.iaeon.phone,
+                    password=self._config.iaeon.password,
+                    otp_method=self._config.iaeon.otp_method,
+                )
+                session = await auth.login()
 
-            # Fetch receipts
-            fetcher = ReceiptFetcher(session)
-            entries = await fetcher.fetch_recent_receipts(
-                days=self._config.iaeon.receipt_days
-            )
-            food_items = fetcher.extract_food_items(entries)
+                # Fetch receipts
+                fetcher = ReceiptFetcher(session)
+                entries = await fetcher.fetch_recent_receipts(
+                    days=self._config.iaeon.receipt_days
+                )
+                food_items = fetcher.extract_food_items(entries)
 
-            # Store in DB
-            db = InventoryDB(self._config.database.path)
-            try:
-                ids = db.add_food_items(food_items)
+                # Store in DB
+                ids = self._inventory_db.add_food_items(food_items)
                 logger.info("食品 %d 件をDBに登録しました", len(ids))
-            finally:
-                db.close()
 
-        except Exception:
-            logger.exception("レシート取得ジョブでエラーが発生しました")
+            except Exception:
+                logger.exception("レシート取得ジョブでエラーが発生しました")
 
     async def _job_generate_plan(self) -> None:
         """Generate a nutritionally balanced meal plan from inventory."""
         logger.info("献立生成ジョブ実行中...")
 
-        try:
-            from ..client import Cookpad
-            from .db import InventoryDB, MealHistoryDB
-            from .nutrition.calculator import NutritionTargets
-            from .planner import NutritionAwareMealPlanner
+        # Run after any receipt fetch that is still in progress
+        async with self._fetch_lock:
+            pass
 
+        try:
             # Get active inventory
-            db = InventoryDB(self._config.database.path)
-            try:
-                ingredients = db.get_inventory_as_ingredients()
-            finally:
-                db.close()
+            ingredients = self._inventory_db.get_inventory_as_ingredients()
 
             if not ingredients:
                 logger.warning("在庫が空のため献立生成をスキップします")
@@ -211,45 +267,40 @@ class MealPlanScheduler:
                 )
 
             # Save to history
-            history_db = MealHistoryDB(self._config.database.path)
-            try:
-                plan_data = {
-                    "date": plan.date,
-                    "detected_ingredients": plan.detected_ingredients,
-                    "meals": [
-                        {
-                            "meal_type": m.meal_type,
-                            "main_dish": {"id": m.main_dish.id, "title": m.main_dish.title},
-                            "side_dishes": [
-                                {"id": s.id, "title": s.title}
-                                for s in m.side_dishes
-                            ],
-                        }
-                        for m in plan.meals
-                    ],
-                }
-                dn = plan.daily_nutrition
-                history_db.save_plan(
-                    plan_date=plan.date,
-                    plan_json=plan_data,
-                    source="iaeon",
-                    total_calories=dn.total_energy if dn else None,
-                    total_protein=dn.total_protein if dn else None,
-                    total_fat=dn.total_fat if dn else None,
-                    total_carbs=dn.total_carbs if dn else None,
-                )
-                logger.info("献立を履歴に保存しました: %s", plan.date)
-            finally:
-                history_db.close()
+            plan_data = {
+                "date": plan.date,
+                "detected_ingredients": plan.detected_ingredients,
+                "meals": [
+                    {
+                        "meal_type": m.meal_type,
+                        "main_dish": {"id": m.main_dish.id, "title": m.main_dish.title},
+                        "side_dishes": [
+                            {"id": s.id, "title": s.title}
+                            for s in m.side_dishes
+                        ],
+                    }
+                    for m in plan.meals
+                ],
+            }
+            dn = plan.daily_nutrition
+            self._history_db.save_plan(
+                plan_date=plan.date,
+                plan_json=plan_data,
+                source="iaeon",
+                total_calories=dn.total_energy if dn else None,
+                total_protein=dn.total_protein if dn else None,
+                total_fat=dn.total_fat if dn else None,
+                total_carbs=dn.total_carbs if dn else None,
+            )
+            logger.info("献立を履歴に保存しました: %s", plan.date)
 
             # Generate PDF if gdrive is enabled
             if self._config.gdrive.enabled:
-                from .gdrive import GoogleDriveUploader
-                from .pdf import generate_pdf
-
-                pdf_path = Path(tempfile.mktemp(suffix=".pdf", prefix="kondate_"))
+                # Render in memory; nothing is written to the SD card
+                buf = io.BytesIO()
                 try:
-                    generate_pdf(plan, pdf_path, daily_nutrition=dn)
+                    generate_pdf(plan, buf, daily_nutrition=dn)
+                    buf.seek(0)
 
                     uploader = GoogleDriveUploader(
                         credentials_path=self._config.gdrive.credentials_path,
@@ -257,30 +308,26 @@ class MealPlanScheduler:
                         folder_id=self._config.gdrive.folder_id,
                     )
                     filename = f"{plan.date} の献立.pdf"
-                    file_id = uploader.upload(pdf_path, filename=filename)
+                    file_id = uploader.upload_fileobj(buf, filename=filename)
                     logger.info("Google Drive にアップロード完了: %s", file_id)
                 except Exception:
                     logger.exception("PDF生成/アップロードでエラーが発生しました")
-                finally:
-                    if pdf_path.exists():
-                        pdf_path.unlink()
 
         except Exception:
             logger.exception("献立生成ジョブでエラーが発生しました")
 
+    async def _job_fetch_then_plan(self) -> None:
+        """Fetch receipts, then generate a plan from the updated inventory."""
+        await self._job_fetch_receipts()
+        await self._job_generate_plan()
+
     async def _job_expire_items(self) -> None:
         """Mark expired items in the inventory."""
         logger.info("期限切れチェック実行中...")
 
         try:
-            from .db import InventoryDB
-
-            db = InventoryDB(self._config.database.path)
-            try:
-                count = db.mark_expired()
-                if count > 0:
-                    logger.info("期限切れ食品 %d 件をマークしました", count)
-            finally:
-                db.close()
+            count = self._inventory_db.mark_expired()
+            if count > 0:
+                logger.info("期限切れ食品 %d 件をマークしました", count)
         except Exception:
             logger.exception("期限切れチェックでエラーが発生しました")
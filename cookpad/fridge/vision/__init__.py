@@ -2,13 +2,38 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import mimetypes
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from ..config import FridgeConfig
 
+# Per-image API requests a cloud backend keeps in flight at once
+_MAX_CONCURRENT_REQUESTS = 4
+
+# Ingredient-listing prompt shared by the cloud (Claude / Gemini) backends
+_PROMPT = """\
+この画像は冷蔵庫の中を撮影したものです。
+写っている食材をすべて日本語で列挙してください。
+
+以下のJSON形式で返してください（他のテキストは不要です）:
+[
+  {"name": "食材名", "confidence": 0.0〜1.0, "category": "カテゴリ"}
+]
+
+カテゴリは以下から選んでください:
+野菜, 果物, 肉, 魚, 卵, 乳製品, 豆腐・大豆, 調味料, 飲料, 穀物, その他
+
+confidence は食材がはっきり見える場合は 0.8〜1.0、
+やや不確かな場合は 0.5〜0.8、ほとんど見えない場合は 0.5 未満としてください。
+"""
+
 
 @dataclass
 class DetectedIngredient:
@@ -31,33 +56,63 @@ class VisionBackend(ABC):
         ...
 
 
+@functools.lru_cache(maxsize=16)
+def _mime(ext: str) -> str:
+    """Return the image MIME type for a file extension such as ``.png``."""
+    return mimetypes.guess_type(f"x{ext}")[0] or "image/jpeg"
+
+
+def _merge_detections(
+    groups: Iterable[list[DetectedIngredient]],
+) -> list[DetectedIngredient]:
+    """Merge per-image detections, keeping the highest confidence per name."""
+    seen: dict[str, DetectedIngredient] = {}
+    for group in groups:
+        for det in group:
+            current = seen.get(det.name)
+            if current is None or det.confidence > current.confidence:
+                seen[det.name] = det
+    return list(seen.values())
+
+
+# Backend name -> (module, class, constructor kwargs from config). Modules
+# are imported on demand so each backend's SDK is only needed when chosen.
+_BACKENDS: dict[str, tuple[str, str, Callable[[FridgeConfig], dict[str, Any]]]] = {
+    "claude": (
+        ".claude",
+        "ClaudeVisionBackend",
+        lambda config: {
+            "api_key": config.vision.claude.api_key,
+            "model": config.vision.claude.model,
+        },
+    ),
+    "gemini": (
+        ".gemini",
+        "GeminiVisionBackend",
+        lambda config: {
+            "api_key": config.vision.gemini.api_key,
+            "model": config.vision.gemini.model,
+        },
+    ),
+    "ai_hat": (
+        ".ai_hat",
+        "AIHatVisionBackend",
+        lambda config: {"model_path": config.vision.ai_hat.model_path},
+    ),
+}
+
+
 def create_backend(config: FridgeConfig) -> VisionBackend:
     """Create a vision backend based on configuration."""
     backend_name = config.vision.backend
 
-    match backend_name:
-        case "claude":
-            from .claude import ClaudeVisionBackend
-
-            return ClaudeVisionBackend(
-                api_key=config.vision.claude.api_key,
-                model=config.vision.claude.model,
-            )
-        case "gemini":
-            from .gemini import GeminiVisionBackend
-
-            return GeminiVisionBackend(
-                api_key=config.vision.gemini.api_key,
-                model=config.vision.gemini.model,
-            )
-        case "ai_hat":
-            from .ai_hat import AIHatVisionBackend
-
-            return AIHatVisionBackend(
-                model_path=config.vision.ai_hat.model_path,
-            )
-        case _:
-            raise ValueError(
-                f"不明なVisionバックエンド: {backend_name!r}  "
-                f"(claude / gemini / ai_hat から選択してください)"
-            )
+    try:
+        module_name, class_name, make_kwargs = _BACKENDS[backend_name]
+    except KeyError:
+        raise ValueError(
+            f"不明なVisionバックエンド: {backend_name!r}  "
+            f"(claude / gemini / ai_hat から選択してください)"
+        ) from None
+
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)(**make_kwargs(config))
@@ -2,28 +2,36 @@
 
 from __future__ import annotations
 
-import base64
-import json
-import mimetypes
+import asyncio
+import mmap
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from . import DetectedIngredient, VisionBackend
+try:
+    import orjson as _json
+except ImportError:  # optional speedup; stdlib json parses the same input
+    import json as _json
 
-_PROMPT = """\
-この画像は冷蔵庫の中を撮影したものです。
-写っている食材をすべて日本語で列挙してください。
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # optional SIMD encoder; stdlib output is identical
+    from base64 import standard_b64encode as _b64encode
 
-以下のJSON形式で返してください（他のテキストは不要です）:
-[
-  {"name": "食材名", "confidence": 0.0〜1.0, "category": "カテゴリ"}
-]
+from . import (
+    _MAX_CONCURRENT_REQUESTS,
+    _PROMPT,
+    DetectedIngredient,
+    VisionBackend,
+    _merge_detections,
+    _mime,
+)
 
-カテゴリは以下から選んでください:
-野菜, 果物, 肉, 魚, 卵, 乳製品, 豆腐・大豆, 調味料, 飲料, 穀物, その他
+if TYPE_CHECKING:
+    import anthropic
 
-confidence は食材がはっきり見える場合は 0.8〜1.0、
-やや不確かな場合は 0.5〜0.8、ほとんど見えない場合は 0.5 未満としてください。
-"""
+# Sent once per image; built once since the SDK does not mutate it
+_PROMPT_BLOCK = {"type": "text", "text": _PROMPT}
 
 
 class ClaudeVisionBackend(VisionBackend):
@@ -32,6 +40,8 @@ class ClaudeVisionBackend(VisionBackend):
     def __init__(self, api_key: str = "", model: str = "claude-sonnet-4-5-20250929") -> None:
         self._api_key = api_key
         self._model = model
+        # Created on first use and kept so its connection pool stays warm
+        self._client: anthropic.AsyncAnthropic | None = None
 
     async def detect_ingredients(
         self, image_paths: list[str]
@@ -42,38 +52,69 @@ class ClaudeVisionBackend(VisionBackend):
                 "設定ファイルまたは ANTHROPIC_API_KEY 環境変数を確認してください。"
             )
 
-        try:
-            import anthropic
-        except ImportError:
-            raise ImportError(
-                "anthropic SDK is required: pip install anthropic"
-            ) from None
-
-        content: list[dict] = []
-        for path in image_paths:
-            data = Path(path).read_bytes()
-            media_type = mimetypes.guess_type(path)[0] or "image/jpeg"
-            content.append(
+        if self._client is None:
+            try:
+                import anthropic
+            except ImportError:
+                raise ImportError(
+                    "anthropic SDK is required: pip install anthropic"
+                ) from None
+            self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
+
+        client = self._client
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        results = await asyncio.gather(
+            *(self._detect_one(client, semaphore, path) for path in image_paths)
+        )
+        return _merge_detections(results)
+
+    async def aclose(self) -> None:
+        """Close the cached API client and its connections."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def _detect_one(
+        self,
+        client: anthropic.AsyncAnthropic,
+        semaphore: asyncio.Semaphore,
+        path: str,
+    ) -> list[DetectedIngredient]:
+        """Detect ingredients in a single image."""
+        media_type = _mime(Path(path).suffix.lower())
+        async with semaphore:
+            content: list[dict] = [
                 {
                     "type": "image",
                     "source": {
                         "type": "base64",
                         "media_type": media_type,
-                        "data": base64.standard_b64encode(data).decode(),
+                        "data": _encode_image(path),
                     },
-                }
+                },
+                _PROMPT_BLOCK,
+            ]
+            response = await client.messages.create(
+                model=self._model,
+                max_tokens=4096,
+                messages=[{"role": "user", "content": content}],
             )
-        content.append({"type": "text", "text": _PROMPT})
 
-        client = anthropic.AsyncAnthropic(api_key=self._api_key)
-        response = await client.messages.create(
-            model=self._model,
-            max_tokens=4096,
-            messages=[{"role": "user", "content": content}],
-        )
+        return _parse_response(response.content[0].text)
+
+
+def _encode_image(path: str) -> str:
+    """Base64-encode an image file via mmap.
 
-        text = response.content[0].text
-        return _parse_response(text)
+    Encoding straight from the mapping keeps the raw bytes in the page
+    cache instead of holding a full copy on the heap next to the base64.
+    """
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _b64encode(mm).decode("ascii")
 
 
 def _parse_response(text: str) -> list[DetectedIngredient]:
@@ -86,7 +127,7 @@ def _parse_response(text: str) -> list[DetectedIngredient]:
         lines = [l for l in lines[1:] if not l.strip().startswith("```")]
         cleaned = "\n".join(lines)
 
-    items = json.loads(cleaned)
+    items = _json.loads(cleaned)
     seen: dict[str, DetectedIngredient] = {}
     for item in items:
         name = item["name"]
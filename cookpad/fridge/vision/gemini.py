@@ -2,26 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from pathlib import Path
+from typing import Any
 
-from . import DetectedIngredient, VisionBackend
+try:
+    import orjson as _json
+except ImportError:  # optional speedup; stdlib json parses the same input
+    import json as _json
 
-_PROMPT = """\
-この画像は冷蔵庫の中を撮影したものです。
-写っている食材をすべて日本語で列挙してください。
-
-以下のJSON形式で返してください（他のテキストは不要です）:
-[
-  {"name": "食材名", "confidence": 0.0〜1.0, "category": "カテゴリ"}
-]
-
-カテゴリは以下から選んでください:
-野菜, 果物, 肉, 魚, 卵, 乳製品, 豆腐・大豆, 調味料, 飲料, 穀物, その他
-
-confidence は食材がはっきり見える場合は 0.8〜1.0、
-やや不確かな場合は 0.5〜0.8、ほとんど見えない場合は 0.5 未満としてください。
-"""
+from . import (
+    _MAX_CONCURRENT_REQUESTS,
+    _PROMPT,
+    DetectedIngredient,
+    VisionBackend,
+    _merge_detections,
+    _mime,
+)
 
 
 class GeminiVisionBackend(VisionBackend):
@@ -30,6 +27,8 @@ class GeminiVisionBackend(VisionBackend):
     def __init__(self, api_key: str = "", model: str = "gemini-2.0-flash") -> None:
         self._api_key = api_key
         self._model = model
+        # GenerativeModel built on first use and reused across scans
+        self._client: Any = None
 
     async def detect_ingredients(
         self, image_paths: list[str]
@@ -40,23 +39,38 @@ class GeminiVisionBackend(VisionBackend):
                 "設定ファイルまたは GEMINI_API_KEY 環境変数を確認してください。"
             )
 
-        try:
-            import google.generativeai as genai
-        except ImportError:
-            raise ImportError(
-                "google-generativeai SDK is required: pip install google-generativeai"
-            ) from None
-
-        genai.configure(api_key=self._api_key)
-        model = genai.GenerativeModel(self._model)
-
-        parts: list = []
-        for path in image_paths:
-            data = Path(path).read_bytes()
-            parts.append({"mime_type": "image/jpeg", "data": data})
-        parts.append(_PROMPT)
-
-        response = await model.generate_content_async(parts)
+        if self._client is None:
+            try:
+                import google.generativeai as genai
+            except ImportError:
+                raise ImportError(
+                    "google-generativeai SDK is required: pip install google-generativeai"
+                ) from None
+
+            genai.configure(api_key=self._api_key)
+            self._client = genai.GenerativeModel(self._model)
+
+        model = self._client
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        results = await asyncio.gather(
+            *(self._detect_one(model, semaphore, path) for path in image_paths)
+        )
+        return _merge_detections(results)
+
+    async def _detect_one(
+        self,
+        model: Any,
+        semaphore: asyncio.Semaphore,
+        path: str,
+    ) -> list[DetectedIngredient]:
+        """Detect ingredients in a single image."""
+        suffix = Path(path).suffix.lower()
+        async with semaphore:
+            # Read inside the semaphore so at most _MAX_CONCURRENT_REQUESTS
+            # images are held in memory at once
+            image = {"mime_type": _mime(suffix), "data": Path(path).read_bytes()}
+            response = await model.generate_content_async([image, _PROMPT])
         return _parse_response(response.text)
 
 
@@ -68,7 +82,7 @@ def _parse_response(text: str) -> list[DetectedIngredient]:
         lines = [l for l in lines[1:] if not l.strip().startswith("```")]
         cleaned = "\n".join(lines)
 
-    items = json.loads(cleaned)
+    items = _json.loads(cleaned)
     seen: dict[str, DetectedIngredient] = {}
     for item in items:
         name = item["name"]
@@ -5,29 +5,37 @@ import asyncio
 import os
 import re
 import sys
+from operator import itemgetter
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # レシートの非商品行を追加フィルタ（parse_receiptで残ったゴミ）
-_EXTRA_NON_FOOD = re.compile(
-    r"小\s*計|合\s*計|支払|残高|お釣|お預|現\s*金|"
-    r"カード会社|伝票番号|ﾏｽﾀｰ|VISA|ｲｵﾝ|"
-    r"値引|割引|円引|10円引|20円引|"
-    r"\d{4,}",  # 伝票番号のような大きな数値のみの商品名
-)
+# 固定語は部分文字列で判定し、正規表現は数値のみ使う
+_NON_FOOD_TOKENS = frozenset((
+    "小計", "合計", "支払", "残高", "お釣", "お預", "現金",
+    "カード会社", "伝票番号", "ﾏｽﾀｰ", "VISA", "ｲｵﾝ",
+    "値引", "割引", "円引",
+))
+_DIGITS4_SEARCH = re.compile(r"\d{4,}").search  # 伝票番号のような大きな数値
+
+# iAEON の購入日時 (YYYYMMDDhhmm...) の先頭8桁
+_DATE8_MATCH = re.compile(r"(\d{4})(\d{2})(\d{2})").match
 
 
 def is_cooking_ingredient(name: str) -> bool:
     """料理に使える食材かどうかを判定"""
     # 明らかなお菓子・飲料は除外しない（お菓子でも料理に使える場合がある）
     # ただし非商品行は除外
-    if _EXTRA_NON_FOOD.search(name):
-        return False
     if len(name) <= 1:
         return False
-    return True
+    # 「小 計」のような空白入りの表記もまとめて判定する
+    compact = "".join(name.split())
+    for token in _NON_FOOD_TOKENS:
+        if token in compact:
+            return False
+    return _DIGITS4_SEARCH(name) is None
 
 
 async def main():
@@ -68,7 +76,10 @@ async def main():
             return input("SMSで届いた6桁の認証コードを入力: ").strip()
 
     try:
-        access_token = auth.full_login(phone, password, otp_provider)
+        # full_login は OTP 待ち (最大120秒) を含む同期処理なのでスレッドで実行
+        access_token = await asyncio.to_thread(
+            auth.full_login, phone, password, otp_provider
+        )
         print(f"[OK] ログイン成功!")
         print(f"[DEBUG] access_token: {access_token[:30]}...")
     except Exception as e:
@@ -83,32 +94,35 @@ async def main():
     from iaeon.inventory import parse_receipt
     from datetime import date, timedelta
 
-    if not receipt_account_id:
-        print("[DEBUG] receipt_account_id を取得中...")
-        temp = IAEONReceiptClient(access_token=access_token, receipt_account_id="")
-        info = temp.get_user_receipt_info()
-        receipt_account_id = info.get("receipt_account_id", "")
-        print(f"[DEBUG] receipt_account_id: {receipt_account_id}")
-
+    # クライアントは1つだけ作り、未設定なら同じセッションで accountId を解決する
     client = IAEONReceiptClient(
         access_token=access_token,
         receipt_account_id=receipt_account_id,
     )
+    if not client.receipt_account_id:
+        print("[DEBUG] receipt_account_id を取得中...")
+        info = client.get_user_receipt_info()
+        client.receipt_account_id = info.get("receipt_account_id", "")
+        print(f"[DEBUG] receipt_account_id: {client.receipt_account_id}")
 
     print("[DEBUG] レシートサービス認証中...")
     jwt = client.auth_receipt()
     print(f"[OK] receipt JWT取得成功")
 
     days = 90
-    to_date = date.today().strftime("%Y%m%d")
-    from_date = (date.today() - timedelta(days=days)).strftime("%Y%m%d")
+    today = date.today()
+    to_date = f"{today:%Y%m%d}"
+    from_date = f"{today - timedelta(days=days):%Y%m%d}"
     print(f"[DEBUG] レシート一覧取得: {from_date} ~ {to_date} ({days}日間)")
 
     summaries = client.list_receipts(from_date, to_date)
     print(f"[OK] レシート {len(summaries)} 件取得")
 
-    for i, s in enumerate(summaries):
-        print(f"  [{i+1}] {s.store_name} | {s.datetime[:10]} | ¥{s.total or '?'}")
+    # 件数が多いので1回の write でまとめて出力
+    sys.stdout.write("".join(
+        f"  [{i}] {s.store_name} | {s.datetime[:10]} | ¥{s.total or '?'}\n"
+        for i, s in enumerate(summaries, 1)
+    ))
 
     print()
 
@@ -120,44 +134,51 @@ async def main():
 
     all_entries: list[ReceiptEntry] = []
 
-    for summary in summaries:
-        detail = client.get_receipt_detail(summary.receipt_id)
+    # 詳細取得は同期HTTPなのでスレッドで並列化（iAEON側への同時接続は8まで）
+    sem = asyncio.Semaphore(8)
+
+    async def fetch(s):
+        async with sem:
+            return s, await asyncio.to_thread(client.get_receipt_detail, s.receipt_id)
+
+    details = await asyncio.gather(*(fetch(s) for s in summaries))
+
+    for summary, detail in details:
         parsed = parse_receipt(detail, summary)
 
         raw_dt = parsed.purchased_at or ""
-        if "T" in raw_dt:
-            purchase_date = raw_dt[:10]
-        elif len(raw_dt) >= 8 and raw_dt[:8].isdigit():
-            purchase_date = f"{raw_dt[:4]}-{raw_dt[4:6]}-{raw_dt[6:8]}"
-        else:
-            purchase_date = raw_dt[:10]
-
-        for product in parsed.products:
-            all_entries.append(
-                ReceiptEntry(
-                    product_name=product.name,
-                    price=product.price,
-                    quantity=product.quantity,
-                    receipt_id=parsed.receipt_id,
-                    purchase_date=purchase_date,
-                    store_name=parsed.store_name,
-                    barcode=product.barcode or "",
-                )
+        m = None if "T" in raw_dt else _DATE8_MATCH(raw_dt)
+        purchase_date = f"{m[1]}-{m[2]}-{m[3]}" if m else raw_dt[:10]
+
+        all_entries.extend(
+            ReceiptEntry(
+                product_name=product.name,
+                price=product.price,
+                quantity=product.quantity,
+                receipt_id=parsed.receipt_id,
+                purchase_date=purchase_date,
+                store_name=parsed.store_name,
+                barcode=product.barcode or "",
             )
+            for product in parsed.products
+        )
 
     print(f"[DEBUG] 全商品 (raw): {len(all_entries)} 件")
 
     # ReceiptFetcherで食品フィルタリング
     dummy_session = IAEONSession(access_token=access_token, device_id=device_id)
     fetcher = ReceiptFetcher(dummy_session)
-    food_items = fetcher.extract_food_items(all_entries)
-
     # 追加フィルタ: 非商品行を除去
-    food_items = [f for f in food_items if is_cooking_ingredient(f.name)]
+    food_items = [
+        f for f in fetcher.extract_food_items(all_entries)
+        if is_cooking_ingredient(f.name)
+    ]
 
     print(f"[OK] 食品アイテム: {len(food_items)} 件\n")
-    for item in food_items:
-        print(f"  - {item.name:<20s} ({item.category}) ¥{item.price}")
+    sys.stdout.write("".join(
+        f"  - {item.name:<20s} ({item.category}) ¥{item.price}\n"
+        for item in food_items
+    ))
 
     if not food_items:
         print("[WARN] 食品が見つかりませんでした。")
@@ -178,27 +199,50 @@ async def main():
         cooking_items = food_items
 
     # 期限の近いものを優先
-    sorted_items = sorted(cooking_items, key=lambda x: x.estimated_expiry or "9999")
-    priority_names = list(dict.fromkeys(item.name for item in sorted_items))[:5]
+    # キーは一度だけ作り、比較はタプルの先頭要素だけで行う
+    keyed = [(item.estimated_expiry or "9999", item) for item in cooking_items]
+    keyed.sort(key=itemgetter(0))
+    sorted_items = [item for _, item in keyed]
+    priority_names: list[str] = []
+    seen: set[str] = set()
+    for item in sorted_items:
+        if item.name in seen:
+            continue
+        seen.add(item.name)
+        priority_names.append(item.name)
+        if len(priority_names) == 5:
+            break
     print(f"[DEBUG] 優先食材: {', '.join(priority_names)}")
 
     async with Cookpad() as cookpad:
         all_recipes = []
 
+        # 組み合わせ検索と個別検索をまとめて並列実行
+        combo_query = " ".join(priority_names[:3]) if len(priority_names) >= 2 else ""
+        individual = priority_names[:5]
+        search_tasks = [cookpad.search_recipes(n) for n in individual]
+        if combo_query:
+            search_tasks.insert(0, cookpad.search_recipes(combo_query))
+        search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+
         # まず組み合わせ検索
-        if len(priority_names) >= 2:
-            combo_query = " ".join(priority_names[:3])
+        if combo_query:
+            result = search_results.pop(0)
             print(f"[DEBUG] 組み合わせ検索: '{combo_query}'")
-            result = await cookpad.search_recipes(combo_query)
-            all_recipes.extend(result.recipes)
-            print(f"  → {len(result.recipes)} 件")
+            if isinstance(result, Exception):
+                print(f"  → 失敗: {result}")
+            else:
+                all_recipes.extend(result.recipes)
+                print(f"  → {len(result.recipes)} 件")
 
         # 個別食材でも検索
-        for name in priority_names[:5]:
+        existing_ids = {r.id for r in all_recipes}
+        for name, result in zip(individual, search_results):
             print(f"[DEBUG] 個別検索: '{name}'")
-            result = await cookpad.search_recipes(name)
+            if isinstance(result, Exception):
+                print(f"  → 失敗: {result}")
+                continue
             # 重複除去しつつ追加
-            existing_ids = {r.id for r in all_recipes}
             for r in result.recipes[:5]:
                 if r.id not in existing_ids:
                     all_recipes.append(r)
@@ -212,7 +256,13 @@ async def main():
         print("  🍳 おすすめレシピ (レシートの食材から)")
         print("=" * 60)
 
-        for i, recipe in enumerate(all_recipes[:10], 1):
+        top_recipes = all_recipes[:10]
+        details = await asyncio.gather(
+            *(cookpad.get_recipe(r.id) for r in top_recipes),
+            return_exceptions=True,
+        )
+
+        for i, (recipe, detail) in enumerate(zip(top_recipes, details), 1):
             print(f"\n{'─' * 50}")
             print(f"  {i}. {recipe.title}")
             print(f"     by {recipe.user.name if recipe.user else '不明'}")
@@ -221,18 +271,16 @@ async def main():
                 story = recipe.story[:80]
                 print(f"     {story}{'...' if len(recipe.story) > 80 else ''}")
 
-            # レシピ詳細を取得して材料を表示
-            try:
-                detail = await cookpad.get_recipe(recipe.id)
-                if detail.ingredients:
-                    ing_text = ", ".join(
-                        f"{ing.name}({ing.quantity})" for ing in detail.ingredients[:8]
-                    )
-                    print(f"     材料: {ing_text}")
-                if detail.steps:
-                    print(f"     手順: {len(detail.steps)}ステップ")
-            except Exception:
-                pass
+            # 先に取得したレシピ詳細から材料を表示
+            if isinstance(detail, Exception):
+                continue
+            if detail.ingredients:
+                ing_text = ", ".join(
+                    f"{ing.name}({ing.quantity})" for ing in detail.ingredients[:8]
+                )
+                print(f"     材料: {ing_text}")
+            if detail.steps:
+                print(f"     手順: {len(detail.steps)}ステップ")
 
     print(f"\n{'=' * 60}")
     print("  完了!")
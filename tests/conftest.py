@@ -0,0 +1,41 @@
+"""Shared pytest configuration.
+
+Tests write scratch files through ``tmp_path``; to keep them on tmpfs, run
+``pytest --basetemp=/dev/shm/pytest``.
+"""
+
+import copy
+
+import pytest
+
+from cookpad.fridge.config import FridgeConfig, load_config
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (e.g. full PDF rendering)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def base_config() -> FridgeConfig:
+    """Default configuration, loaded once per session. Do not mutate."""
+    return load_config()
+
+
+@pytest.fixture
+def config(base_config: FridgeConfig) -> FridgeConfig:
+    """Per-test copy of the default configuration, safe to modify."""
+    return copy.deepcopy(base_config)
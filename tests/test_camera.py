@@ -1,8 +1,7 @@
 """Tests for fridge camera module (mocked OpenCV)."""
 
 import sys
-import tempfile
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -11,10 +10,11 @@ import pytest
 from cookpad.fridge.camera import CameraCapture, FridgeCamera
 
 
-@pytest.fixture
-def tmp_dir():
-    with tempfile.TemporaryDirectory() as d:
-        yield d
+@pytest.fixture(autouse=True)
+def _reset_absent_cache():
+    FridgeCamera._known_absent = {}
+    yield
+    FridgeCamera._known_absent = {}
 
 
 @pytest.fixture
@@ -26,12 +26,12 @@ def mock_cv2():
 
 
 class TestFridgeCamera:
-    def test_init_creates_save_dir(self, tmp_dir):
-        save_dir = Path(tmp_dir) / "sub" / "dir"
+    def test_init_creates_save_dir(self, tmp_path):
+        save_dir = tmp_path / "sub" / "dir"
         cam = FridgeCamera(camera_indices=[0], save_dir=str(save_dir))
         assert save_dir.exists()
 
-    def test_capture_success(self, mock_cv2, tmp_dir):
+    def test_capture_success(self, mock_cv2, tmp_path):
         """Successful capture saves a file and returns CameraCapture."""
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = True
@@ -39,7 +39,7 @@ class TestFridgeCamera:
         mock_cv2.VideoCapture.return_value = mock_cap
         mock_cv2.imwrite.return_value = True
 
-        cam = FridgeCamera(camera_indices=[0], save_dir=tmp_dir)
+        cam = FridgeCamera(camera_indices=[0], save_dir=str(tmp_path))
         result = cam.capture(0)
 
         assert isinstance(result, CameraCapture)
@@ -47,29 +47,29 @@ class TestFridgeCamera:
         assert result.captured_at  # ISO8601 string
         mock_cap.release.assert_called_once()
 
-    def test_capture_camera_not_found(self, mock_cv2, tmp_dir):
+    def test_capture_camera_not_found(self, mock_cv2, tmp_path):
         """RuntimeError when camera cannot be opened."""
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = False
         mock_cv2.VideoCapture.return_value = mock_cap
 
-        cam = FridgeCamera(camera_indices=[0], save_dir=tmp_dir)
+        cam = FridgeCamera(camera_indices=[0], save_dir=str(tmp_path))
         with pytest.raises(RuntimeError, match="カメラ 0"):
             cam.capture(0)
 
-    def test_capture_read_failure(self, mock_cv2, tmp_dir):
+    def test_capture_read_failure(self, mock_cv2, tmp_path):
         """RuntimeError when frame read fails."""
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = True
         mock_cap.read.return_value = (False, None)
         mock_cv2.VideoCapture.return_value = mock_cap
 
-        cam = FridgeCamera(camera_indices=[0], save_dir=tmp_dir)
+        cam = FridgeCamera(camera_indices=[0], save_dir=str(tmp_path))
         with pytest.raises(RuntimeError, match="フレームを取得"):
             cam.capture(0)
         mock_cap.release.assert_called_once()
 
-    def test_capture_all(self, mock_cv2, tmp_dir):
+    def test_capture_all(self, mock_cv2, tmp_path):
         """capture_all captures from all configured cameras."""
         mock_cap = MagicMock()
         mock_cap.isOpened.return_value = True
@@ -77,7 +77,7 @@ class TestFridgeCamera:
         mock_cv2.VideoCapture.return_value = mock_cap
         mock_cv2.imwrite.return_value = True
 
-        cam = FridgeCamera(camera_indices=[0, 1], save_dir=tmp_dir)
+        cam = FridgeCamera(camera_indices=[0, 1], save_dir=str(tmp_path))
         results = cam.capture_all()
 
         assert len(results) == 2
@@ -86,13 +86,46 @@ class TestFridgeCamera:
 
     def test_list_cameras(self, mock_cv2):
         """list_cameras probes indices and returns available ones."""
-        caps = {}
-        for i in range(10):
-            m = MagicMock()
-            m.isOpened.return_value = i in (0, 2)
-            caps[i] = m
+        caps = {
+            i: MagicMock(isOpened=MagicMock(return_value=i in (0, 2)))
+            for i in range(10)
+        }
 
         mock_cv2.VideoCapture.side_effect = lambda i: caps[i]
 
         result = FridgeCamera.list_cameras()
         assert result == [0, 2]
+
+    def test_list_cameras_skips_known_absent(self, mock_cv2):
+        """Indices that failed to open are not probed again."""
+        caps = {
+            i: MagicMock(isOpened=MagicMock(return_value=i in (0, 2)))
+            for i in range(10)
+        }
+        mock_cv2.VideoCapture.side_effect = lambda i: caps[i]
+
+        FridgeCamera.list_cameras()
+        mock_cv2.VideoCapture.reset_mock()
+        result = FridgeCamera.list_cameras()
+
+        assert result == [0, 2]
+        probed = [c.args[0] for c in mock_cv2.VideoCapture.call_args_list]
+        assert probed == [0, 2]
+
+    def test_list_cameras_reprobes_after_ttl(self, mock_cv2, monkeypatch):
+        """A camera plugged in after a scan is found once the entry expires."""
+        plugged = {0}
+        mock_cv2.VideoCapture.side_effect = lambda i: MagicMock(
+            isOpened=MagicMock(return_value=i in plugged)
+        )
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "cookpad.fridge.camera.time", SimpleNamespace(monotonic=lambda: clock[0])
+        )
+
+        assert FridgeCamera.list_cameras(max_check=3) == [0]
+        plugged.add(1)
+        assert FridgeCamera.list_cameras(max_check=3) == [0]
+
+        clock[0] += FridgeCamera._ABSENT_TTL
+        assert FridgeCamera.list_cameras(max_check=3) == [0, 1]
@@ -32,7 +32,6 @@ async def client():
 # --- search_recipes ---
 
 
-@pytest.mark.asyncio
 async def test_search_recipes_basic(client: Cookpad):
     results = await client.search_recipes("カレー", per_page=5)
     assert isinstance(results, SearchResponse)
@@ -41,7 +40,6 @@ async def test_search_recipes_basic(client: Cookpad):
     assert results.next_page is not None
 
 
-@pytest.mark.asyncio
 async def test_search_recipes_recipe_fields(client: Cookpad):
     results = await client.search_recipes("カレー", per_page=1)
     recipe = results.recipes[0]
@@ -53,14 +51,12 @@ async def test_search_recipes_recipe_fields(client: Cookpad):
     assert isinstance(recipe.user, User)
 
 
-@pytest.mark.asyncio
 async def test_search_recipes_order_popular(client: Cookpad):
     results = await client.search_recipes("パスタ", order="popular", per_page=3)
     assert isinstance(results, SearchResponse)
     assert len(results.recipes) > 0
 
 
-@pytest.mark.asyncio
 async def test_search_recipes_excluded_ingredients(client: Cookpad):
     results = await client.search_recipes(
         "カレー", excluded_ingredients="トマト", per_page=3
@@ -69,7 +65,6 @@ async def test_search_recipes_excluded_ingredients(client: Cookpad):
     assert results.total_count > 0
 
 
-@pytest.mark.asyncio
 async def test_search_recipes_pagination(client: Cookpad):
     page1 = await client.search_recipes("サラダ", page=1, per_page=5)
     assert page1.next_page == 2
@@ -81,7 +76,6 @@ async def test_search_recipes_pagination(client: Cookpad):
     assert ids1 != ids2
 
 
-@pytest.mark.asyncio
 async def test_search_recipes_raw_access(client: Cookpad):
     results = await client.search_recipes("ラーメン", per_page=1)
     assert "result" in results.raw
@@ -91,7 +85,6 @@ async def test_search_recipes_raw_access(client: Cookpad):
 # --- get_recipe ---
 
 
-@pytest.mark.asyncio
 async def test_get_recipe(client: Cookpad):
     recipe = await client.get_recipe(25410768)
     assert isinstance(recipe, Recipe)
@@ -101,7 +94,6 @@ async def test_get_recipe(client: Cookpad):
     assert recipe.href
 
 
-@pytest.mark.asyncio
 async def test_get_recipe_has_steps(client: Cookpad):
     recipe = await client.get_recipe(25410768)
     assert len(recipe.steps) > 0
@@ -110,7 +102,6 @@ async def test_get_recipe_has_steps(client: Cookpad):
     assert step.description
 
 
-@pytest.mark.asyncio
 async def test_get_recipe_has_ingredients(client: Cookpad):
     recipe = await client.get_recipe(25410768)
     assert len(recipe.ingredients) > 0
@@ -120,7 +111,6 @@ async def test_get_recipe_has_ingredients(client: Cookpad):
     assert ing.quantity
 
 
-@pytest.mark.asyncio
 async def test_get_recipe_has_user(client: Cookpad):
     recipe = await client.get_recipe(25410768)
     assert recipe.user is not None
@@ -129,7 +119,6 @@ async def test_get_recipe_has_user(client: Cookpad):
     assert recipe.user.name
 
 
-@pytest.mark.asyncio
 async def test_get_recipe_not_found(client: Cookpad):
     with pytest.raises(NotFoundError):
         await client.get_recipe(999999999)
@@ -138,7 +127,6 @@ async def test_get_recipe_not_found(client: Cookpad):
 # --- get_similar_recipes ---
 
 
-@pytest.mark.asyncio
 async def test_get_similar_recipes(client: Cookpad):
     similar = await client.get_similar_recipes(25410768, per_page=5)
     assert isinstance(similar, list)
@@ -151,14 +139,12 @@ async def test_get_similar_recipes(client: Cookpad):
 # --- get_comments ---
 
 
-@pytest.mark.asyncio
 async def test_get_comments(client: Cookpad):
     result = await client.get_comments(18510866, limit=3)
     assert isinstance(result, CommentsResponse)
     assert len(result.comments) > 0
 
 
-@pytest.mark.asyncio
 async def test_get_comments_fields(client: Cookpad):
     result = await client.get_comments(18510866, limit=3)
     comment = result.comments[0]
@@ -170,7 +156,6 @@ async def test_get_comments_fields(client: Cookpad):
     assert isinstance(comment.user, User)
 
 
-@pytest.mark.asyncio
 async def test_get_comments_cursor_pagination(client: Cookpad):
     result = await client.get_comments(18510866, limit=3)
     assert result.next_cursor is not None
@@ -186,7 +171,6 @@ async def test_get_comments_cursor_pagination(client: Cookpad):
 # --- search_users ---
 
 
-@pytest.mark.asyncio
 async def test_search_users(client: Cookpad):
     result = await client.search_users("test", per_page=5)
     assert isinstance(result, UsersResponse)
@@ -194,7 +178,6 @@ async def test_search_users(client: Cookpad):
     assert len(result.users) > 0
 
 
-@pytest.mark.asyncio
 async def test_search_users_fields(client: Cookpad):
     result = await client.search_users("test", per_page=1)
     user = result.users[0]
@@ -207,14 +190,12 @@ async def test_search_users_fields(client: Cookpad):
 # --- search_keywords ---
 
 
-@pytest.mark.asyncio
 async def test_search_keywords(client: Cookpad):
     result = await client.search_keywords("カレ")
     assert isinstance(result, dict)
     assert "search_query" in result
 
 
-@pytest.mark.asyncio
 async def test_search_keywords_empty(client: Cookpad):
     result = await client.search_keywords("")
     assert isinstance(result, dict)
@@ -223,7 +204,6 @@ async def test_search_keywords_empty(client: Cookpad):
 # --- get_search_history ---
 
 
-@pytest.mark.asyncio
 async def test_get_search_history(client: Cookpad):
     result = await client.get_search_history()
     assert isinstance(result, dict)
@@ -233,14 +213,12 @@ async def test_get_search_history(client: Cookpad):
 # --- context manager ---
 
 
-@pytest.mark.asyncio
 async def test_context_manager():
     async with Cookpad() as client:
         results = await client.search_recipes("test", per_page=1)
         assert len(results.recipes) >= 0
 
 
-@pytest.mark.asyncio
 async def test_without_context_manager():
     """Client should auto-create httpx client if not using context manager."""
     client = Cookpad()
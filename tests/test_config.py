@@ -1,9 +1,5 @@
 """Tests for fridge config loading."""
 
-import os
-import tempfile
-from pathlib import Path
-
 from cookpad.fridge.config import (
     CameraConfig,
     CookpadConfig,
@@ -40,7 +36,7 @@ def test_load_config_nonexistent_file():
     assert config.camera.indices == [0]
 
 
-def test_load_config_from_toml():
+def test_load_config_from_toml(tmp_path):
     """Loading a valid TOML file populates config."""
     toml_content = b"""\
 [camera]
@@ -63,12 +59,9 @@ recipes_per_meal = 2
 country = "US"
 language = "en"
 """
-    with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
-        f.write(toml_content)
-        f.flush()
-        config = load_config(f.name)
-
-    os.unlink(f.name)
+    config_file = tmp_path / "config.toml"
+    config_file.write_bytes(toml_content)
+    config = load_config(config_file)
 
     assert config.camera.indices == [0, 1, 2]
     assert config.camera.save_dir == "/var/fridge"
@@ -90,7 +83,7 @@ def test_load_config_env_override(monkeypatch):
     assert config.vision.gemini.api_key == "env-gemini-key"
 
 
-def test_load_config_file_key_takes_precedence(monkeypatch):
+def test_load_config_file_key_takes_precedence(tmp_path, monkeypatch):
     """Config file API key takes precedence over env var."""
     monkeypatch.setenv("ANTHROPIC_API_KEY", "env-key")
 
@@ -98,51 +91,45 @@ def test_load_config_file_key_takes_precedence(monkeypatch):
 [vision.claude]
 api_key = "file-key"
 """
-    with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
-        f.write(toml_content)
-        f.flush()
-        config = load_config(f.name)
+    config_file = tmp_path / "config.toml"
+    config_file.write_bytes(toml_content)
+    config = load_config(config_file)
 
-    os.unlink(f.name)
     assert config.vision.claude.api_key == "file-key"
 
 
-def test_load_config_partial_toml():
+def test_load_config_partial_toml(tmp_path):
     """Partial TOML uses defaults for missing sections."""
     toml_content = b"""\
 [camera]
 indices = [3]
 """
-    with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
-        f.write(toml_content)
-        f.flush()
-        config = load_config(f.name)
+    config_file = tmp_path / "config.toml"
+    config_file.write_bytes(toml_content)
+    config = load_config(config_file)
 
-    os.unlink(f.name)
     assert config.camera.indices == [3]
     # Other sections use defaults
     assert config.vision.backend == "claude"
     assert config.planner.meals_per_day == 3
 
 
-def test_load_config_printer_section():
+def test_load_config_printer_section(tmp_path):
     """Loading printer config from TOML."""
     toml_content = b"""\
 [printer]
 enabled = true
 printer_name = "Brother_HL"
 """
-    with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
-        f.write(toml_content)
-        f.flush()
-        config = load_config(f.name)
+    config_file = tmp_path / "config.toml"
+    config_file.write_bytes(toml_content)
+    config = load_config(config_file)
 
-    os.unlink(f.name)
     assert config.printer.enabled is True
     assert config.printer.printer_name == "Brother_HL"
 
 
-def test_load_config_gdrive_section():
+def test_load_config_gdrive_section(tmp_path):
     """Loading Google Drive config from TOML."""
     toml_content = b"""\
 [gdrive]
@@ -151,19 +138,17 @@ credentials_path = "/custom/creds.json"
 token_path = "/custom/token.json"
 folder_id = "abc123"
 """
-    with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
-        f.write(toml_content)
-        f.flush()
-        config = load_config(f.name)
+    config_file = tmp_path / "config.toml"
+    config_file.write_bytes(toml_content)
+    config = load_config(config_file)
 
-    os.unlink(f.name)
     assert config.gdrive.enabled is True
     assert config.gdrive.credentials_path == "/custom/creds.json"
     assert config.gdrive.token_path == "/custom/token.json"
     assert config.gdrive.folder_id == "abc123"
 
 
-def test_load_config_custom_storage_locations():
+def test_load_config_custom_storage_locations(tmp_path):
     """Custom storage_locations are merged with defaults."""
     toml_content = b"""\
 [planner.storage_locations]
@@ -171,12 +156,10 @@ def test_load_config_custom_storage_locations():
 "\xe8\x82\x89" = "\xe5\x86\xb7\xe5\x87\x8d\xe5\xae\xa4"
 """
     # That's: 野菜 = "冷蔵室上段", 肉 = "冷凍室" in UTF-8
-    with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
-        f.write(toml_content)
-        f.flush()
-        config = load_config(f.name)
+    config_file = tmp_path / "config.toml"
+    config_file.write_bytes(toml_content)
+    config = load_config(config_file)
 
-    os.unlink(f.name)
     assert config.planner.storage_locations["野菜"] == "冷蔵室上段"
     assert config.planner.storage_locations["肉"] == "冷凍室"
     # Defaults preserved for non-overridden keys
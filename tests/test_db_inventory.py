@@ -6,14 +6,26 @@ from cookpad.fridge.db.inventory import InventoryDB
 from cookpad.fridge.iaeon.models import FoodItem
 
 
-@pytest.fixture
-def db(tmp_path):
-    """Create a temporary InventoryDB."""
-    inventory = InventoryDB(db_path=tmp_path / "test.db")
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    """Create one temporary InventoryDB shared by the module."""
+    inventory = InventoryDB(db_path=tmp_path_factory.mktemp("db") / "test.db")
     yield inventory
     inventory.close()
 
 
+@pytest.fixture(autouse=True)
+def _empty_inventory(db):
+    """Clear the shared inventory after each test.
+
+    InventoryDB commits inside its methods, so a rollback can't undo them.
+    """
+    yield
+    conn = db._get_conn()
+    conn.execute("DELETE FROM food_inventory")
+    conn.commit()
+
+
 @pytest.fixture
 def sample_items():
     """Sample food items for testing."""
@@ -48,6 +60,32 @@ def test_add_food_items(db, sample_items):
     assert all(isinstance(i, int) for i in ids)
 
 
+def test_add_food_items_ids_match_rows(db, sample_items):
+    """Returned IDs identify the inserted rows in input order."""
+    db.add_food_items(sample_items)
+    ids = db.add_food_items(sample_items)
+
+    rows = {i["id"]: i["name"] for i in db.get_active_inventory()}
+    assert [rows[i] for i in ids] == ["トマト", "鶏もも肉"]
+    assert db.add_food_items([]) == []
+
+
+def test_add_food_items_ids_with_interleaved_rows(db, sample_items):
+    """IDs stay correct when other rows are inserted between the items."""
+    db._get_conn().execute(
+        """CREATE TEMP TRIGGER shadow_row AFTER INSERT ON food_inventory
+           WHEN NEW.status = 'active'
+           BEGIN
+               INSERT INTO food_inventory (name, status)
+               VALUES ('shadow', 'consumed');
+           END"""
+    )
+    ids = db.add_food_items(sample_items)
+
+    rows = {i["id"]: i["name"] for i in db.get_active_inventory()}
+    assert [rows[i] for i in ids] == ["トマト", "鶏もも肉"]
+
+
 def test_get_active_inventory(db, sample_items):
     """Get active inventory items."""
     db.add_food_items(sample_items)
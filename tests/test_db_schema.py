@@ -4,6 +4,11 @@ import sqlite3
 
 import pytest
 
+from cookpad.fridge.db.inventory import (
+    _ACTIVE_INVENTORY_SQL,
+    _EXPIRING_SOON_SQL,
+    _MARK_EXPIRED_SQL,
+)
 from cookpad.fridge.db.schema import _SCHEMA_VERSION, ensure_schema
 
 
@@ -67,6 +72,17 @@ def test_ensure_schema_wal_mode(tmp_path):
     conn.close()
 
 
+def test_ensure_schema_synchronous_normal(tmp_path):
+    """Schema relaxes fsync to NORMAL and keeps temp tables in memory."""
+    db_path = tmp_path / "test.db"
+    conn = ensure_schema(db_path)
+
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    conn.close()
+
+
 def test_food_inventory_columns(tmp_path):
     """food_inventory table has expected columns."""
     db_path = tmp_path / "test.db"
@@ -83,3 +99,24 @@ def test_food_inventory_columns(tmp_path):
     assert expected.issubset(col_names)
 
     conn.close()
+
+
+@pytest.mark.parametrize(
+    ("sql", "params"),
+    [
+        (_ACTIVE_INVENTORY_SQL, ()),
+        (_EXPIRING_SOON_SQL, ("2025-01-01", 3)),
+        (_MARK_EXPIRED_SQL, ("2025-01-01",)),
+    ],
+    ids=["active_inventory", "expiring_soon", "mark_expired"],
+)
+def test_status_queries_use_status_expiration_index(tmp_path, sql, params):
+    """Status-filtered queries are index range scans, not table scans."""
+    conn = ensure_schema(tmp_path / "test.db")
+
+    plan = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+    detail = " ".join(row["detail"] for row in plan)
+    assert "idx_inventory_status_expiration" in detail
+    assert "TEMP B-TREE" not in detail  # ORDER BY comes from the index
+
+    conn.close()
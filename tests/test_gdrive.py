@@ -1,24 +1,62 @@
 """Tests for Google Drive uploader."""
 
+import io
 import sys
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from cookpad.fridge.gdrive import GoogleDriveUploader
 
 
-def _mock_googleapiclient():
-    """Context manager that mocks googleapiclient.http.MediaFileUpload."""
-    mock_http = MagicMock()
-    mock_api = MagicMock()
-    mock_api.http = mock_http
-    return patch.dict("sys.modules", {
-        "googleapiclient": mock_api,
-        "googleapiclient.http": mock_http,
-    })
+# Stand-ins for every google module the uploader imports lazily. They are
+# installed once for the whole module; call history is cleared per test.
+_GOOGLE_STUBS = {
+    name: Mock()
+    for name in (
+        "google",
+        "google.auth",
+        "google.auth.transport",
+        "google.auth.transport.requests",
+        "google.oauth2",
+        "google.oauth2.credentials",
+        "google_auth_oauthlib",
+        "google_auth_oauthlib.flow",
+        "googleapiclient",
+        "googleapiclient.discovery",
+        "googleapiclient.http",
+    )
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _google_stubs():
+    with patch.dict("sys.modules", _GOOGLE_STUBS):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_google_stubs():
+    yield
+    for mock in _GOOGLE_STUBS.values():
+        mock.reset_mock()
+
+
+@pytest.fixture
+def uploader_with_mock():
+    """Factory for an uploader wired to a mock Drive service.
+
+    Returns ``(uploader, files, create)`` where ``files`` is
+    ``service.files()`` and ``create`` is ``files.create()``.
+    """
+    def make(**kwargs):
+        uploader = GoogleDriveUploader(**kwargs)
+        uploader._service = Mock(spec=["files"])
+        files = uploader._service.files.return_value
+        return uploader, files, files.create.return_value
+
+    return make
 
 
 class TestGoogleDriveUploader:
@@ -45,98 +83,81 @@ class TestGoogleDriveUploader:
     def test_upload_file_not_found(self):
         """Raises FileNotFoundError for nonexistent file."""
         uploader = GoogleDriveUploader()
-        uploader._service = MagicMock()
+        uploader._service = Mock(spec=["files"])
 
         with pytest.raises(FileNotFoundError, match="ファイルが見つかりません"):
             uploader.upload("/nonexistent/file.pdf")
 
-    def test_upload_success(self, tmp_path):
+    def test_upload_success(self, tmp_path, uploader_with_mock):
         """Uploads file and returns file ID."""
         pdf_file = tmp_path / "test.pdf"
         pdf_file.write_text("dummy pdf content")
 
-        uploader = GoogleDriveUploader(folder_id="folder123")
-
-        mock_service = MagicMock()
-        mock_files = MagicMock()
-        mock_create = MagicMock()
+        uploader, mock_files, mock_create = uploader_with_mock(folder_id="folder123")
         mock_create.execute.return_value = {"id": "file_abc123"}
-        mock_files.create.return_value = mock_create
-        mock_service.files.return_value = mock_files
-        uploader._service = mock_service
 
-        with _mock_googleapiclient():
-            file_id = uploader.upload(pdf_file, filename="献立.pdf")
+        file_id = uploader.upload(pdf_file, filename="献立.pdf")
 
         assert file_id == "file_abc123"
-        call_kwargs = mock_files.create.call_args
-        body = call_kwargs.kwargs.get("body") or call_kwargs[1].get("body")
+        body = mock_files.create.call_args.kwargs["body"]
         assert body["name"] == "献立.pdf"
         assert body["parents"] == ["folder123"]
 
-    def test_upload_default_filename(self, tmp_path):
+    def test_upload_default_filename(self, tmp_path, uploader_with_mock):
         """Uses local filename when no filename specified."""
         pdf_file = tmp_path / "output.pdf"
         pdf_file.write_text("dummy")
 
-        uploader = GoogleDriveUploader()
-        mock_service = MagicMock()
-        mock_files = MagicMock()
-        mock_create = MagicMock()
+        uploader, mock_files, mock_create = uploader_with_mock()
         mock_create.execute.return_value = {"id": "file_xyz"}
-        mock_files.create.return_value = mock_create
-        mock_service.files.return_value = mock_files
-        uploader._service = mock_service
 
-        with _mock_googleapiclient():
-            file_id = uploader.upload(pdf_file)
+        file_id = uploader.upload(pdf_file)
 
-        call_kwargs = mock_files.create.call_args
-        body = call_kwargs.kwargs.get("body") or call_kwargs[1].get("body")
+        body = mock_files.create.call_args.kwargs["body"]
         assert body["name"] == "output.pdf"
 
-    def test_upload_no_folder(self, tmp_path):
+    def test_upload_no_folder(self, tmp_path, uploader_with_mock):
         """No parents key when folder_id is empty."""
         pdf_file = tmp_path / "test.pdf"
         pdf_file.write_text("dummy")
 
-        uploader = GoogleDriveUploader()
-        mock_service = MagicMock()
-        mock_files = MagicMock()
-        mock_create = MagicMock()
+        uploader, mock_files, mock_create = uploader_with_mock()
         mock_create.execute.return_value = {"id": "file_123"}
-        mock_files.create.return_value = mock_create
-        mock_service.files.return_value = mock_files
-        uploader._service = mock_service
 
-        with _mock_googleapiclient():
-            uploader.upload(pdf_file)
+        uploader.upload(pdf_file)
 
-        call_kwargs = mock_files.create.call_args
-        body = call_kwargs.kwargs.get("body") or call_kwargs[1].get("body")
+        body = mock_files.create.call_args.kwargs["body"]
         assert "parents" not in body
 
-    def test_upload_override_folder(self, tmp_path):
+    def test_upload_override_folder(self, tmp_path, uploader_with_mock):
         """folder_id parameter overrides configured default."""
         pdf_file = tmp_path / "test.pdf"
         pdf_file.write_text("dummy")
 
-        uploader = GoogleDriveUploader(folder_id="default_folder")
-        mock_service = MagicMock()
-        mock_files = MagicMock()
-        mock_create = MagicMock()
+        uploader, mock_files, mock_create = uploader_with_mock(folder_id="default_folder")
         mock_create.execute.return_value = {"id": "file_456"}
-        mock_files.create.return_value = mock_create
-        mock_service.files.return_value = mock_files
-        uploader._service = mock_service
 
-        with _mock_googleapiclient():
-            uploader.upload(pdf_file, folder_id="override_folder")
+        uploader.upload(pdf_file, folder_id="override_folder")
 
-        call_kwargs = mock_files.create.call_args
-        body = call_kwargs.kwargs.get("body") or call_kwargs[1].get("body")
+        body = mock_files.create.call_args.kwargs["body"]
         assert body["parents"] == ["override_folder"]
 
+    def test_upload_fileobj(self, uploader_with_mock):
+        """Uploads an in-memory buffer without touching the filesystem."""
+        uploader, mock_files, mock_create = uploader_with_mock(folder_id="folder123")
+        mock_create.execute.return_value = {"id": "file_mem"}
+
+        buf = io.BytesIO(b"%PDF-1.4 dummy")
+        file_id = uploader.upload_fileobj(buf, filename="献立.pdf")
+        media_cls = _GOOGLE_STUBS["googleapiclient.http"].MediaIoBaseUpload
+
+        assert file_id == "file_mem"
+        media_cls.assert_called_once_with(
+            buf, mimetype="application/pdf", resumable=False
+        )
+        body = mock_files.create.call_args.kwargs["body"]
+        assert body == {"name": "献立.pdf", "parents": ["folder123"]}
+
     def test_get_service_no_credentials_file(self, tmp_path):
         """Raises FileNotFoundError when credentials file missing."""
         uploader = GoogleDriveUploader(
@@ -144,22 +165,9 @@ class TestGoogleDriveUploader:
             token_path=str(tmp_path / "token.json"),
         )
 
-        mock_creds_module = MagicMock()
-        mock_creds_class = MagicMock()
-        mock_creds_module.Credentials = mock_creds_class
-
-        with patch.dict("sys.modules", {
-            "google": MagicMock(),
-            "google.auth": MagicMock(),
-            "google.auth.transport": MagicMock(),
-            "google.auth.transport.requests": MagicMock(),
-            "google.oauth2": MagicMock(),
-            "google.oauth2.credentials": mock_creds_module,
-            "google_auth_oauthlib": MagicMock(),
-            "google_auth_oauthlib.flow": MagicMock(),
-            "googleapiclient": MagicMock(),
-            "googleapiclient.discovery": MagicMock(),
-        }):
-            mock_creds_class.from_authorized_user_file.side_effect = Exception
+        credentials = _GOOGLE_STUBS["google.oauth2.credentials"].Credentials
+        with patch.object(
+            credentials, "from_authorized_user_file", side_effect=Exception
+        ):
             with pytest.raises(FileNotFoundError, match="クレデンシャル"):
                 uploader._get_service()
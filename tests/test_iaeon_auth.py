@@ -61,7 +61,6 @@ def test_authenticator_init_with_device_id():
     assert auth._device_id == "my-device-001"
 
 
-@pytest.mark.asyncio
 async def test_mock_otp_handler():
     """MockOTPHandler returns the configured code."""
     handler = MockOTPHandler("654321")
@@ -69,13 +68,11 @@ async def test_mock_otp_handler():
     assert code == "654321"
 
 
-@pytest.mark.asyncio
 async def test_login_without_iaeon_raises_import_error(monkeypatch):
     """Login raises ImportError if iaeon is not installed."""
     import sys
 
-    # Temporarily hide iaeon from imports
-    real_iaeon = sys.modules.pop("iaeon", None)
+    # monkeypatch restores the real entry (or its absence) on teardown
     monkeypatch.setitem(sys.modules, "iaeon", None)
 
     handler = MockOTPHandler()
@@ -85,24 +82,20 @@ async def test_login_without_iaeon_raises_import_error(monkeypatch):
         otp_handler=handler,
     )
 
-    try:
-        with pytest.raises(ImportError, match="iaeon"):
-            await auth.login()
-    finally:
-        # Restore iaeon module
-        if real_iaeon is not None:
-            sys.modules["iaeon"] = real_iaeon
-        else:
-            sys.modules.pop("iaeon", None)
-
-
-@pytest.mark.asyncio
-async def test_login_with_bad_credentials_raises_runtime_error():
-    """Login with bad credentials raises RuntimeError."""
-    try:
-        import iaeon  # noqa: F401
-    except ImportError:
-        pytest.skip("iaeon not installed")
+    with pytest.raises(ImportError, match="iaeon"):
+        await auth.login()
+
+
+async def test_login_with_bad_credentials_raises_runtime_error(monkeypatch):
+    """Login failures from the iaeon library are wrapped in RuntimeError."""
+    import sys
+    from types import ModuleType
+    from unittest.mock import MagicMock
+
+    fake_iaeon = ModuleType("iaeon")
+    fake_iaeon.IAEONAuth = MagicMock()
+    fake_iaeon.IAEONAuth.return_value.full_login.side_effect = Exception("bad creds")
+    monkeypatch.setitem(sys.modules, "iaeon", fake_iaeon)
 
     handler = MockOTPHandler()
     auth = IAEONAuthenticator(
@@ -111,5 +104,5 @@ async def test_login_with_bad_credentials_raises_runtime_error():
         otp_handler=handler,
     )
 
-    with pytest.raises(RuntimeError, match="iAEON認証に失敗しました"):
+    with pytest.raises(RuntimeError, match="iAEON認証に失敗しました: bad creds"):
         await auth.login()
@@ -12,19 +12,36 @@ from cookpad.fridge.nutrition.mext_data import MEXTDatabase
 from cookpad.types import Ingredient, Recipe
 
 
-@pytest.fixture(autouse=True)
-def reset_mext():
-    MEXTDatabase.reset()
-    yield
-    MEXTDatabase.reset()
+# Shared read-only meals; DailyNutrition never mutates its inputs
+_MEAL_500 = MealNutrition(
+    energy_kcal=500, protein=20, fat=15, carbohydrate=70,
+    fiber=5, salt_equivalent=2.0,
+)
+_MEAL_700 = MealNutrition(
+    energy_kcal=700, protein=30, fat=25, carbohydrate=90,
+    fiber=8, salt_equivalent=3.0,
+)
+# Perfect match for 2000 kcal: P=15%, F=25%, C=60%
+_MEAL_ON_TARGET = MealNutrition(
+    energy_kcal=2000,
+    protein=75,        # 75*4=300 = 15% of 2000
+    fat=55.56,         # 55.56*9=500 = 25% of 2000
+    carbohydrate=300,  # 300*4=1200 = 60% of 2000
+)
+
 
+@pytest.fixture(scope="session", autouse=True)
+def mext_db():
+    """Load the read-only MEXT table once for the whole session."""
+    return MEXTDatabase.instance()
 
-@pytest.fixture
-def calculator():
-    return NutritionCalculator()
 
+@pytest.fixture(scope="session")
+def calculator(mext_db):
+    return NutritionCalculator(mext_db)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_recipe():
     return Recipe(
         id=1,
@@ -40,10 +57,14 @@ def sample_recipe():
     )
 
 
-def test_calculate_recipe_nutrition(calculator, sample_recipe):
-    """Basic recipe nutrition calculation."""
-    result = calculator.calculate_recipe_nutrition(sample_recipe)
+def test_calculate_recipe_and_daily_nutrition(calculator, sample_recipe):
+    """Per-recipe nutrition is computed and aggregated across the day."""
+    daily = calculator.calculate_daily_nutrition([sample_recipe, sample_recipe])
 
+    assert len(daily.meals) == 2
+    assert daily.total_energy > 0
+
+    result = daily.meals[0]
     assert isinstance(result, MealNutrition)
     assert result.recipe_title == "トマトと卵の炒め物"
     assert result.energy_kcal > 0
@@ -92,13 +113,7 @@ def test_nutrition_targets_gram_calculations():
 
 def test_daily_nutrition_totals():
     """DailyNutrition correctly sums meal nutritions."""
-    meals = [
-        MealNutrition(energy_kcal=500, protein=20, fat=15, carbohydrate=70,
-                       fiber=5, salt_equivalent=2.0),
-        MealNutrition(energy_kcal=700, protein=30, fat=25, carbohydrate=90,
-                       fiber=8, salt_equivalent=3.0),
-    ]
-    dn = DailyNutrition(meals=meals)
+    dn = DailyNutrition(meals=[_MEAL_500, _MEAL_700])
 
     assert dn.total_energy == 1200
     assert dn.total_protein == 50
@@ -126,16 +141,7 @@ def test_daily_nutrition_pfc_percentages():
 def test_balance_score_perfect():
     """Balance score for perfect PFC match is high."""
     targets = NutritionTargets(energy_kcal=2000)
-    # Perfect match: P=15%, F=25%, C=60%
-    meals = [
-        MealNutrition(
-            energy_kcal=2000,
-            protein=75,        # 75*4=300 = 15% of 2000
-            fat=55.56,         # 55.56*9=500 = 25% of 2000
-            carbohydrate=300,  # 300*4=1200 = 60% of 2000
-        ),
-    ]
-    dn = DailyNutrition(meals=meals, targets=targets)
+    dn = DailyNutrition(meals=[_MEAL_ON_TARGET], targets=targets)
     assert dn.balance_score > 0.9
 
 
@@ -147,8 +153,7 @@ def test_balance_score_empty():
 
 def test_summary_dict():
     """summary_dict returns serializable dict."""
-    meals = [MealNutrition(energy_kcal=500, protein=20, fat=15, carbohydrate=60)]
-    dn = DailyNutrition(meals=meals)
+    dn = DailyNutrition(meals=[_MEAL_500])
     d = dn.summary_dict()
 
     assert "total_energy_kcal" in d
@@ -157,14 +162,6 @@ def test_summary_dict():
     assert isinstance(d["balance_score"], float)
 
 
-def test_calculate_daily_nutrition(calculator, sample_recipe):
-    """calculate_daily_nutrition works with multiple recipes."""
-    result = calculator.calculate_daily_nutrition([sample_recipe, sample_recipe])
-
-    assert len(result.meals) == 2
-    assert result.total_energy > 0
-
-
 def test_parse_serving_count():
     """Serving count extraction from various formats."""
     assert NutritionCalculator._parse_serving_count("2人分") == 2.0
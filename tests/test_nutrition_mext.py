@@ -5,12 +5,10 @@ import pytest
 from cookpad.fridge.nutrition.mext_data import MEXTDatabase, NutrientInfo
 
 
-@pytest.fixture(autouse=True)
-def reset_singleton():
-    """Reset the singleton before each test."""
-    MEXTDatabase.reset()
-    yield
-    MEXTDatabase.reset()
+@pytest.fixture(scope="session", autouse=True)
+def mext_db():
+    """Load the read-only MEXT table once for the whole session."""
+    return MEXTDatabase.instance()
 
 
 def test_singleton():
@@ -50,6 +48,15 @@ def test_lookup_by_name_not_found():
     assert info is None
 
 
+def test_lookup_by_name_memoized():
+    """Repeated fuzzy lookups are served from the per-instance cache."""
+    db = MEXTDatabase.instance()
+    first = db.lookup_by_name("鶏もも")
+    hits = db.lookup_by_name.cache_info().hits
+    assert db.lookup_by_name("鶏もも") is first
+    assert db.lookup_by_name.cache_info().hits == hits + 1
+
+
 def test_lookup_by_id():
     """ID-based lookup works."""
     db = MEXTDatabase.instance()
@@ -1,8 +1,9 @@
 """Tests for PDF generation."""
 
-import tempfile
+import io
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -78,94 +79,117 @@ def _make_plan() -> DailyMealPlan:
     )
 
 
-class TestPDFGeneration:
-    def test_generate_pdf_import_error(self):
-        """generate_pdf raises ImportError when reportlab is not installed."""
-        with patch.dict("sys.modules", {"reportlab": None}):
-            # Force reimport to pick up the patched module
-            from cookpad.fridge.pdf import generate_pdf
-
-            # The actual import of reportlab submodules happens inside generate_pdf
-            # so we need to mock it differently
-            pass
+def _make_minimal_plan() -> DailyMealPlan:
+    """One meal with a single-ingredient, single-step recipe."""
+    return DailyMealPlan(
+        date="2025-01-15",
+        detected_ingredients=["トマト"],
+        meals=[
+            Meal(
+                meal_type="breakfast",
+                meal_type_ja="朝食",
+                main_dish=_make_recipe(
+                    1,
+                    "トマトサラダ",
+                    ingredients=[Ingredient(name="トマト", quantity="1個")],
+                    steps=[Step(description="トマトを切る")],
+                ),
+                main_dish_ingredients=[
+                    AnnotatedIngredient("トマト", "1個", "野菜室", True),
+                ],
+            ),
+        ],
+    )
 
-    def test_generate_pdf_creates_file(self):
-        """generate_pdf creates a valid PDF file (requires reportlab + font)."""
-        try:
-            from reportlab.lib.pagesizes import A4  # noqa: F401
-        except ImportError:
-            pytest.skip("reportlab not installed")
 
-        from cookpad.fridge.pdf import _find_japanese_font
+@pytest.fixture(scope="session")
+def plan() -> DailyMealPlan:
+    """Sample plan shared by the PDF tests; generate_pdf only reads it."""
+    return _make_plan()
 
-        try:
-            _find_japanese_font()
-        except FileNotFoundError:
-            pytest.skip("No Japanese font available")
 
-        from cookpad.fridge.pdf import generate_pdf
+@pytest.fixture(scope="session")
+def minimal_plan() -> DailyMealPlan:
+    """Smallest plan that still renders a meal, for file-output smoke tests."""
+    return _make_minimal_plan()
 
-        plan = _make_plan()
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output = Path(tmp_dir) / "test_output.pdf"
-            result = generate_pdf(plan, output)
-            assert result == output
-            assert output.exists()
-            assert output.stat().st_size > 0
-            # Check PDF magic bytes
-            with open(output, "rb") as f:
-                assert f.read(4) == b"%PDF"
+@pytest.fixture(scope="module")
+def pdf_dir(tmp_path_factory) -> Path:
+    """Output directory shared by the PDF tests; each writes a distinct file."""
+    return tmp_path_factory.mktemp("pdf")
 
-    def test_generate_pdf_creates_parent_dirs(self):
-        """generate_pdf creates parent directories if needed."""
-        try:
-            from reportlab.lib.pagesizes import A4  # noqa: F401
-        except ImportError:
-            pytest.skip("reportlab not installed")
 
-        from cookpad.fridge.pdf import _find_japanese_font
+@pytest.fixture(scope="session")
+def generate_pdf():
+    """Return generate_pdf once reportlab and a Japanese font are confirmed.
 
-        try:
-            _find_japanese_font()
-        except FileNotFoundError:
-            pytest.skip("No Japanese font available")
+    Resolved once per session; skips every PDF test when either is missing.
+    """
+    pytest.importorskip("reportlab.lib.pagesizes")
 
-        from cookpad.fridge.pdf import generate_pdf
+    from cookpad.fridge.pdf import _find_japanese_font, generate_pdf
 
-        plan = _make_plan()
+    try:
+        _find_japanese_font()
+    except FileNotFoundError:
+        pytest.skip("No Japanese font available")
+    return generate_pdf
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output = Path(tmp_dir) / "subdir" / "nested" / "test.pdf"
-            result = generate_pdf(plan, output)
-            assert output.exists()
 
-    def test_generate_pdf_empty_plan(self):
-        """generate_pdf works with an empty meal plan."""
-        try:
-            from reportlab.lib.pagesizes import A4  # noqa: F401
-        except ImportError:
-            pytest.skip("reportlab not installed")
+class TestPDFGeneration:
+    def test_generate_pdf_import_error(self, monkeypatch, plan):
+        """generate_pdf raises ImportError when reportlab is not installed."""
+        from cookpad.fridge.pdf import generate_pdf
 
-        from cookpad.fridge.pdf import _find_japanese_font
+        for name in [m for m in sys.modules if m.split(".")[0] == "reportlab"]:
+            monkeypatch.setitem(sys.modules, name, None)
+        monkeypatch.setitem(sys.modules, "reportlab", None)
 
-        try:
-            _find_japanese_font()
-        except FileNotFoundError:
-            pytest.skip("No Japanese font available")
+        with pytest.raises(ImportError, match="pip install"):
+            generate_pdf(plan, io.BytesIO())
 
-        from cookpad.fridge.pdf import generate_pdf
+    @pytest.mark.slow
+    def test_generate_pdf_creates_file(self, generate_pdf, minimal_plan, pdf_dir):
+        """generate_pdf creates a valid PDF file (requires reportlab + font)."""
+        output = pdf_dir / "test_output.pdf"
+        result = generate_pdf(minimal_plan, output)
+        assert result == output
+        assert output.exists()
+        assert output.stat().st_size > 0
+        # Check PDF magic bytes
+        with open(output, "rb") as f:
+            assert f.read(4) == b"%PDF"
+
+    @pytest.mark.slow
+    def test_generate_pdf_to_file_object(self, generate_pdf, plan):
+        """generate_pdf writes into a binary file object."""
+        buf = io.BytesIO()
+        result = generate_pdf(plan, buf)
+        assert result is buf
+        assert buf.getvalue()[:4] == b"%PDF"
+
+    @pytest.mark.slow
+    def test_generate_pdf_creates_parent_dirs(
+        self, generate_pdf, minimal_plan, pdf_dir
+    ):
+        """generate_pdf creates parent directories if needed."""
+        output = pdf_dir / "subdir" / "nested" / "test.pdf"
+        result = generate_pdf(minimal_plan, output)
+        assert output.exists()
 
+    @pytest.mark.slow
+    def test_generate_pdf_empty_plan(self, generate_pdf, pdf_dir):
+        """generate_pdf works with an empty meal plan."""
         plan = DailyMealPlan(
             date="2025-01-15",
             detected_ingredients=["トマト"],
             meals=[],
         )
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output = Path(tmp_dir) / "empty.pdf"
-            result = generate_pdf(plan, output)
-            assert output.exists()
+        output = pdf_dir / "empty.pdf"
+        result = generate_pdf(plan, output)
+        assert output.exists()
 
 
 class TestFontDiscovery:
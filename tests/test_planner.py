@@ -1,6 +1,8 @@
 """Tests for meal planner (mocked Cookpad API)."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import functools
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -11,6 +13,9 @@ from cookpad.fridge.planner import (
     MealPlanner,
     _guess_category,
     _match_ingredient,
+    _match_prepared,
+    _pad,
+    _prepare_detected,
     annotate_ingredients,
 )
 from cookpad.fridge.vision import DetectedIngredient
@@ -76,59 +81,66 @@ def _make_search_response(recipes: list[Recipe]) -> SearchResponse:
     )
 
 
-def _make_ingredients() -> list[DetectedIngredient]:
-    return [
-        DetectedIngredient(name="トマト", confidence=0.95, category="野菜"),
-        DetectedIngredient(name="鶏肉", confidence=0.9, category="肉"),
-        DetectedIngredient(name="たまねぎ", confidence=0.85, category="野菜"),
-        DetectedIngredient(name="卵", confidence=0.8, category="卵"),
-        DetectedIngredient(name="にんじん", confidence=0.75, category="野菜"),
-    ]
+@functools.lru_cache(maxsize=None)
+def _cached_detail(id: int) -> Recipe:
+    """Detail recipe per id, built once; the planner never mutates recipes."""
+    return _make_recipe_with_details(id, f"詳細レシピ{id}")
 
 
-class TestGuessCategory:
-    def test_meat_category(self):
-        assert _guess_category("鶏もも肉") == "肉"
-        assert _guess_category("豚バラ肉") == "肉"
-        assert _guess_category("ベーコン") == "肉"
+class _FakeCookpad:
+    """Plain stand-in for the Cookpad client; cheaper than an AsyncMock."""
 
-    def test_vegetable_category(self):
-        assert _guess_category("トマト") == "野菜"
-        assert _guess_category("にんじん") == "野菜"
-        assert _guess_category("ブロッコリー") == "野菜"
+    def __init__(self, search, get_recipe=None):
+        self.search_recipes = search
+        self.get_recipe = get_recipe or self._get_recipe
+        self._client = object()
 
-    def test_seasoning_category(self):
-        assert _guess_category("醤油") == "調味料"
-        assert _guess_category("塩") == "調味料"
-        assert _guess_category("オリーブオイル") == "調味料"
+    @staticmethod
+    async def _get_recipe(id: int) -> Recipe:
+        return _cached_detail(id)
 
-    def test_egg_category(self):
-        assert _guess_category("卵") == "卵"
-        assert _guess_category("たまご") == "卵"
 
-    def test_dairy_category(self):
-        assert _guess_category("チーズ") == "乳製品"
-        assert _guess_category("バター") == "乳製品"
+# The planner only reads detected ingredients, so the tests share one set
+_INGREDIENTS: tuple[DetectedIngredient, ...] = (
+    DetectedIngredient(name="トマト", confidence=0.95, category="野菜"),
+    DetectedIngredient(name="鶏肉", confidence=0.9, category="肉"),
+    DetectedIngredient(name="たまねぎ", confidence=0.85, category="野菜"),
+    DetectedIngredient(name="卵", confidence=0.8, category="卵"),
+    DetectedIngredient(name="にんじん", confidence=0.75, category="野菜"),
+)
 
-    def test_unknown_category(self):
-        assert _guess_category("謎の食材") == "その他"
 
+def _make_ingredients() -> list[DetectedIngredient]:
+    return list(_INGREDIENTS)
 
-class TestMatchIngredient:
-    def test_exact_match(self):
-        assert _match_ingredient("トマト", ["トマト", "鶏肉"]) is True
 
-    def test_partial_match_detected_in_name(self):
-        assert _match_ingredient("鶏もも肉", ["鶏肉", "トマト"]) is True
+@pytest.mark.parametrize("name,expected", [
+    ("鶏もも肉", "肉"), ("豚バラ肉", "肉"), ("ベーコン", "肉"),
+    ("トマト", "野菜"), ("にんじん", "野菜"), ("ブロッコリー", "野菜"),
+    ("醤油", "調味料"), ("塩", "調味料"), ("オリーブオイル", "調味料"),
+    ("卵", "卵"), ("たまご", "卵"),
+    ("チーズ", "乳製品"), ("バター", "乳製品"),
+    ("謎の食材", "その他"),
+])
+def test_guess_category(name, expected):
+    assert _guess_category(name) == expected
 
-    def test_partial_match_name_in_detected(self):
-        assert _match_ingredient("トマト", ["ミニトマト", "鶏肉"]) is True
 
-    def test_no_match(self):
-        assert _match_ingredient("バター", ["トマト", "鶏肉"]) is False
+@pytest.mark.parametrize("name,detected,expected", [
+    ("トマト", ["トマト", "鶏肉"], True),  # exact
+    ("鶏もも肉", ["鶏肉", "トマト"], True),  # detected in name
+    ("トマト", ["ミニトマト", "鶏肉"], True),  # name in detected
+    ("バター", ["トマト", "鶏肉"], False),
+    ("トマト", [], False),
+])
+def test_match_ingredient(name, detected, expected):
+    assert _match_ingredient(name, detected) is expected
 
-    def test_empty_detected(self):
-        assert _match_ingredient("トマト", []) is False
+
+def test_match_prepared_reuses_detected():
+    detected = _prepare_detected(["鶏肉", "トマト"])
+    assert _match_prepared("鶏もも肉", frozenset("鶏もも肉"), detected) is True
+    assert _match_prepared("バター", frozenset("バター"), detected) is False
 
 
 class TestAnnotateIngredients:
@@ -211,6 +223,52 @@ class TestDailyMealPlan:
         assert "砂糖" in names
         assert names.count("塩") == 1  # deduplicated
 
+    def test_add_meal_updates_shopping_list(self):
+        """add_meal() records missing ingredients incrementally."""
+        plan = DailyMealPlan(date="2025-01-15", detected_ingredients=["トマト"])
+        assert plan.shopping_list() == []
+
+        plan.add_meal(
+            Meal(
+                meal_type="breakfast",
+                meal_type_ja="朝食",
+                main_dish=_make_recipe(1, "テスト"),
+                main_dish_ingredients=[
+                    AnnotatedIngredient("トマト", "1個", "野菜室", True),
+                    AnnotatedIngredient("塩", "少々", "ドアポケット", False),
+                ],
+            )
+        )
+        assert len(plan.meals) == 1
+        assert [s.name for s in plan.shopping_list()] == ["塩"]
+
+    def test_shopping_list_follows_direct_meal_edits(self):
+        """Editing plan.meals directly is reflected in shopping_list()."""
+
+        def meal(name: str) -> Meal:
+            return Meal(
+                meal_type="breakfast",
+                meal_type_ja="朝食",
+                main_dish=_make_recipe(1, "テスト"),
+                main_dish_ingredients=[
+                    AnnotatedIngredient(name, "少々", "ドアポケット", False),
+                ],
+            )
+
+        plan = DailyMealPlan(
+            date="2025-01-15", detected_ingredients=[], meals=[meal("塩")]
+        )
+        assert [s.name for s in plan.shopping_list()] == ["塩"]
+
+        plan.meals.append(meal("砂糖"))
+        assert [s.name for s in plan.shopping_list()] == ["塩", "砂糖"]
+
+        plan.meals[0] = meal("バター")
+        assert [s.name for s in plan.shopping_list()] == ["バター", "砂糖"]
+
+        plan.meals.clear()
+        assert plan.shopping_list() == []
+
     def test_display_with_ingredients(self):
         """display() includes ingredient tables and steps."""
         recipe = _make_recipe_with_details(1, "トマトチキン")
@@ -282,12 +340,20 @@ class TestDailyMealPlan:
         assert "サラダ" in text
 
 
+class TestPad:
+    def test_ascii(self):
+        assert _pad("200g", 6) == "200g  "
+
+    def test_wide_characters_count_double(self):
+        assert _pad("トマト", 10) == "トマト    "
+
+    def test_overflow_not_truncated(self):
+        assert _pad("ドアポケット", 8) == "ドアポケット"
+
+
 class TestMealPlanner:
-    @pytest.mark.asyncio
     async def test_plan_daily_basic(self):
         """MealPlanner returns a DailyMealPlan with meals."""
-        mock_client = AsyncMock()
-
         # Return different recipes for each search call
         call_count = 0
         async def mock_search(*args, **kwargs):
@@ -299,11 +365,7 @@ class TestMealPlanner:
                 _make_recipe_with_details(call_count * 10 + 3, f"レシピ{call_count}C"),
             ])
 
-        mock_client.search_recipes = mock_search
-        mock_client.get_recipe = AsyncMock(
-            side_effect=lambda id: _make_recipe_with_details(id, f"詳細レシピ{id}")
-        )
-        mock_client._client = MagicMock()
+        mock_client = _FakeCookpad(mock_search)
 
         planner = MealPlanner(cookpad=mock_client)
         plan = await planner.plan_daily(_make_ingredients())
@@ -315,11 +377,8 @@ class TestMealPlanner:
             assert meal.main_dish is not None
             assert meal.meal_type in ("breakfast", "lunch", "dinner")
 
-    @pytest.mark.asyncio
     async def test_plan_daily_no_duplicates(self):
         """Meals should not share the same recipe."""
-        mock_client = AsyncMock()
-
         counter = 0
         async def mock_search(*args, **kwargs):
             nonlocal counter
@@ -329,11 +388,7 @@ class TestMealPlanner:
                 for i in range(5)
             ])
 
-        mock_client.search_recipes = mock_search
-        mock_client.get_recipe = AsyncMock(
-            side_effect=lambda id: _make_recipe_with_details(id, f"詳細レシピ{id}")
-        )
-        mock_client._client = MagicMock()
+        mock_client = _FakeCookpad(mock_search)
 
         planner = MealPlanner(cookpad=mock_client)
         plan = await planner.plan_daily(_make_ingredients())
@@ -346,14 +401,12 @@ class TestMealPlanner:
         # No duplicate IDs
         assert len(all_ids) == len(set(all_ids))
 
-    @pytest.mark.asyncio
     async def test_plan_daily_filters_low_confidence(self):
         """Ingredients below 0.5 confidence are excluded."""
-        mock_client = AsyncMock()
-        mock_client.search_recipes = AsyncMock(
-            return_value=_make_search_response([_make_recipe(1, "テスト")])
-        )
-        mock_client._client = MagicMock()
+        async def mock_search(*args, **kwargs):
+            return _make_search_response([_make_recipe(1, "テスト")])
+
+        mock_client = _FakeCookpad(mock_search)
 
         low_conf = [
             DetectedIngredient(name="何か", confidence=0.3, category="その他"),
@@ -362,11 +415,8 @@ class TestMealPlanner:
         with pytest.raises(ValueError, match="信頼度"):
             await planner.plan_daily(low_conf)
 
-    @pytest.mark.asyncio
     async def test_plan_daily_custom_meals_count(self):
         """Can request fewer meals."""
-        mock_client = AsyncMock()
-
         counter = 0
         async def mock_search(*args, **kwargs):
             nonlocal counter
@@ -375,11 +425,7 @@ class TestMealPlanner:
                 _make_recipe_with_details(counter * 10 + 1, f"レシピ{counter}"),
             ])
 
-        mock_client.search_recipes = mock_search
-        mock_client.get_recipe = AsyncMock(
-            side_effect=lambda id: _make_recipe_with_details(id, f"詳細レシピ{id}")
-        )
-        mock_client._client = MagicMock()
+        mock_client = _FakeCookpad(mock_search)
 
         planner = MealPlanner(cookpad=mock_client)
         plan = await planner.plan_daily(_make_ingredients(), meals_count=1)
@@ -387,21 +433,17 @@ class TestMealPlanner:
         assert len(plan.meals) == 1
         assert plan.meals[0].meal_type == "breakfast"
 
-    @pytest.mark.asyncio
     async def test_plan_daily_has_annotated_ingredients(self):
         """Meals should have annotated ingredients after planning."""
-        mock_client = AsyncMock()
-
         async def mock_search(*args, **kwargs):
             return _make_search_response([
                 _make_recipe_with_details(1, "トマトチキン"),
             ])
 
-        mock_client.search_recipes = mock_search
-        mock_client.get_recipe = AsyncMock(
-            side_effect=lambda id: _make_recipe_with_details(id, "トマトチキン")
-        )
-        mock_client._client = MagicMock()
+        async def mock_get_recipe(id):
+            return _make_recipe_with_details(id, "トマトチキン")
+
+        mock_client = _FakeCookpad(mock_search, mock_get_recipe)
 
         planner = MealPlanner(cookpad=mock_client)
         plan = await planner.plan_daily(_make_ingredients(), meals_count=1)
@@ -413,21 +455,17 @@ class TestMealPlanner:
         assert len(tomato_ing) > 0
         assert tomato_ing[0].available_in_fridge is True
 
-    @pytest.mark.asyncio
     async def test_plan_daily_with_storage_locations(self):
         """Custom storage_locations are used for annotation."""
-        mock_client = AsyncMock()
-
         async def mock_search(*args, **kwargs):
             return _make_search_response([
                 _make_recipe_with_details(1, "テスト"),
             ])
 
-        mock_client.search_recipes = mock_search
-        mock_client.get_recipe = AsyncMock(
-            side_effect=lambda id: _make_recipe_with_details(id, "テスト")
-        )
-        mock_client._client = MagicMock()
+        async def mock_get_recipe(id):
+            return _make_recipe_with_details(id, "テスト")
+
+        mock_client = _FakeCookpad(mock_search, mock_get_recipe)
 
         custom_locations = {"野菜": "冷蔵室上段", "肉": "冷凍室"}
         planner = MealPlanner(
@@ -438,3 +476,81 @@ class TestMealPlanner:
         meal = plan.meals[0]
         tomato = [i for i in meal.main_dish_ingredients if "トマト" in i.name]
         assert tomato[0].storage_location == "冷蔵室上段"
+
+    async def test_plan_daily_reuses_identical_searches(self):
+        """Identical search queries within one plan hit the API once."""
+        queries: list[str] = []
+        async def mock_search(query, **kwargs):
+            queries.append(query)
+            return _make_search_response([
+                _make_recipe_with_details(len(queries) * 10 + i, f"レシピ{i}")
+                for i in range(8)
+            ])
+
+        mock_client = _FakeCookpad(mock_search)
+
+        planner = MealPlanner(cookpad=mock_client)
+        await planner.plan_daily(_make_ingredients())
+
+        # The side-dish query is the same for every meal
+        assert len(queries) == len(set(queries))
+
+    async def test_plan_daily_runs_meal_searches_concurrently(self):
+        """Every meal's primary search is in flight before any completes."""
+        in_flight = peak = 0
+
+        async def mock_search(query, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _make_search_response([
+                _make_recipe_with_details(hash(query) % 1000 * 10 + i, "レシピ")
+                for i in range(8)
+            ])
+
+        planner = MealPlanner(cookpad=_FakeCookpad(mock_search))
+        await planner.plan_daily(_make_ingredients())
+
+        # Three main-dish searches plus the shared side-dish search
+        assert peak == 4
+
+    async def test_plan_daily_warms_up_owned_client(self):
+        """A planner-owned client opens its connection before searching."""
+        mock_client = AsyncMock()
+        mock_client.search_recipes = AsyncMock(
+            return_value=_make_search_response([_make_recipe_with_details(1, "レシピ")])
+        )
+        mock_client._client = None
+
+        with patch("cookpad.fridge.planner.Cookpad", return_value=mock_client):
+            await MealPlanner().plan_daily(_make_ingredients(), meals_count=1)
+
+        mock_client.warmup.assert_awaited_once()
+
+    async def test_plan_daily_closes_owned_client_when_warmup_fails(self):
+        """The owned client is closed even if warming it up raises."""
+        mock_client = AsyncMock()
+        mock_client.warmup.side_effect = RuntimeError("boom")
+
+        with patch("cookpad.fridge.planner.Cookpad", return_value=mock_client):
+            with pytest.raises(RuntimeError, match="boom"):
+                await MealPlanner().plan_daily(_make_ingredients(), meals_count=1)
+
+        mock_client._client.aclose.assert_awaited_once()
+
+    async def test_plan_daily_skips_fetch_for_complete_recipes(self):
+        """Recipes that already have ingredients and steps are not refetched."""
+        mock_client = AsyncMock()
+        mock_client.search_recipes = AsyncMock(
+            return_value=_make_search_response(
+                [_make_recipe_with_details(i, f"レシピ{i}") for i in range(1, 9)]
+            )
+        )
+        mock_client._client = object()
+
+        planner = MealPlanner(cookpad=mock_client)
+        await planner.plan_daily(_make_ingredients())
+
+        mock_client.get_recipe.assert_not_awaited()
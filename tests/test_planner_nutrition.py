@@ -1,6 +1,6 @@
 """Tests for NutritionAwareMealPlanner and food_items_to_ingredients."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -8,19 +8,44 @@ from cookpad.fridge.iaeon.models import FoodItem
 from cookpad.fridge.planner import (
     NutritionAwareMealPlanner,
     NutritionDailyMealPlan,
+    _best_combination,
     food_items_to_ingredients,
 )
 from cookpad.fridge.vision import DetectedIngredient
-from cookpad.types import Ingredient, Recipe
+from cookpad.types import Ingredient, Recipe, SearchResponse
+
+
+# Receipt items shared by the tests; nothing here mutates them
+_TOMATO = FoodItem(name="トマト", category="野菜", quantity=3.0)
+_CHICKEN = FoodItem(name="鶏もも肉", category="肉", quantity=1.0)
+_SAMPLE_ITEMS = (_TOMATO, _CHICKEN)
+
+
+def _search_response(recipes: list[Recipe]) -> SearchResponse:
+    return SearchResponse(
+        recipes=recipes, total_count=len(recipes), next_page=None, raw={}
+    )
+
+
+@pytest.fixture
+def mock_cookpad_client() -> AsyncMock:
+    """Cookpad client mock whose searches and fetches return one recipe."""
+    recipe = Recipe(
+        id=1,
+        title="トマト炒め",
+        ingredients=[Ingredient(name="トマト", quantity="2個")],
+        steps=[],
+    )
+    client = AsyncMock()
+    client.search_recipes.return_value = _search_response([recipe])
+    client.get_recipe.return_value = recipe
+    client._client = None
+    return client
 
 
 def test_food_items_to_ingredients():
     """Convert FoodItem list to DetectedIngredient list."""
-    items = [
-        FoodItem(name="トマト", category="野菜", quantity=3.0),
-        FoodItem(name="鶏もも肉", category="肉", quantity=1.0),
-    ]
-    result = food_items_to_ingredients(items)
+    result = food_items_to_ingredients(list(_SAMPLE_ITEMS))
 
     assert len(result) == 2
     assert all(isinstance(r, DetectedIngredient) for r in result)
@@ -47,7 +72,6 @@ def test_nutrition_daily_meal_plan_dataclass():
     assert plan.daily_nutrition is None
 
 
-@pytest.mark.asyncio
 async def test_plan_daily_balanced_requires_input():
     """plan_daily_balanced raises ValueError with no input."""
     planner = NutritionAwareMealPlanner()
@@ -55,30 +79,11 @@ async def test_plan_daily_balanced_requires_input():
         await planner.plan_daily_balanced()
 
 
-@pytest.mark.asyncio
-async def test_plan_daily_balanced_with_food_items():
+async def test_plan_daily_balanced_with_food_items(mock_cookpad_client):
     """plan_daily_balanced accepts food_items parameter."""
-    mock_recipe = Recipe(
-        id=1,
-        title="トマト炒め",
-        ingredients=[
-            Ingredient(name="トマト", quantity="2個"),
-        ],
-        steps=[],
-    )
-    mock_search_result = MagicMock()
-    mock_search_result.recipes = [mock_recipe]
-
-    mock_client = AsyncMock()
-    mock_client.search_recipes = AsyncMock(return_value=mock_search_result)
-    mock_client.get_recipe = AsyncMock(return_value=mock_recipe)
-    mock_client._client = None
-
-    planner = NutritionAwareMealPlanner(cookpad=mock_client)
+    planner = NutritionAwareMealPlanner(cookpad=mock_cookpad_client)
 
-    food_items = [
-        FoodItem(name="トマト", category="野菜", quantity=3.0),
-    ]
+    food_items = [_TOMATO]
 
     plan = await planner.plan_daily_balanced(
         food_items=food_items,
@@ -90,6 +95,75 @@ async def test_plan_daily_balanced_with_food_items():
     assert plan.daily_nutrition is not None
 
 
+async def test_plan_daily_balanced_picks_best_candidate(mock_cookpad_client):
+    """plan_daily_balanced selects the candidate with the best PFC balance."""
+    fatty = Recipe(
+        id=1,
+        title="バター炒め",
+        ingredients=[Ingredient(name="バター", quantity="100g")],
+        steps=["炒める"],
+    )
+    balanced = Recipe(
+        id=2,
+        title="鶏ご飯",
+        ingredients=[
+            Ingredient(name="鶏むね肉", quantity="100g"),
+            Ingredient(name="ごはん", quantity="150g"),
+        ],
+        steps=["炊く"],
+    )
+    mock_cookpad_client.search_recipes.return_value = _search_response(
+        [fatty, balanced]
+    )
+
+    planner = NutritionAwareMealPlanner(cookpad=mock_cookpad_client)
+    plan = await planner.plan_daily_balanced(
+        food_items=[FoodItem(name="鶏むね肉", category="肉", quantity=1.0)],
+        meals_count=1,
+        candidate_count=2,
+    )
+
+    assert plan.meals[0].main_dish.id == 2
+
+
+def test_best_combination_balances_whole_day():
+    """Beam search picks the best-balanced set of distinct recipes."""
+    from cookpad.fridge.nutrition.calculator import (
+        MealNutrition,
+        NutritionTargets,
+    )
+
+    def meal(p: float, f: float, c: float) -> MealNutrition:
+        return MealNutrition(
+            energy_kcal=4 * p + 9 * f + 4 * c, protein=p, fat=f, carbohydrate=c
+        )
+
+    nutrition = {
+        1: meal(10, 40, 10),
+        2: meal(15, 5, 60),
+        3: meal(5, 2, 90),
+        4: meal(40, 10, 10),
+    }
+    best = _best_combination([[1, 2], [3, 4], [4]], nutrition, NutritionTargets())
+
+    assert best == [2, 3, 4]
+
+
+def test_best_combination_skips_used_and_empty_slots():
+    """Recipes are not repeated and empty slots yield None."""
+    from cookpad.fridge.nutrition.calculator import (
+        MealNutrition,
+        NutritionTargets,
+    )
+
+    nutrition = {
+        1: MealNutrition(energy_kcal=410, protein=20, fat=10, carbohydrate=60)
+    }
+    best = _best_combination([[1], [1], []], nutrition, NutritionTargets())
+
+    assert best == [1, None, None]
+
+
 def test_nutrition_daily_meal_plan_display_without_nutrition():
     """Display works without nutrition data."""
     plan = NutritionDailyMealPlan(
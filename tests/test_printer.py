@@ -1,41 +1,78 @@
 """Tests for printer module."""
 
 import subprocess
-import tempfile
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from cookpad.fridge.printer import Printer, PrinterInfo
+from cookpad.fridge.printer import Printer, PrinterInfo, _cups_connection
+
+
+def _completed(returncode: int, stdout: str = "", stderr: str = ""):
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr=stderr)
+
+
+class _FakeRun:
+    """Stand-in for subprocess.run that records each command.
+
+    Returns (or raises) the queued ``results`` in order, then succeeds.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.results: list = []
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(cmd)
+        outcome = self.results.pop(0) if self.results else _completed(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture(autouse=True)
+def _no_pycups(monkeypatch):
+    """Exercise the lpstat/lpr path unless a test supplies a CUPS connection."""
+    monkeypatch.setattr("cookpad.fridge.printer._cups_connection", lambda: None)
+
+
+@pytest.fixture(scope="module")
+def pdf_file(tmp_path_factory) -> Path:
+    """Dummy document shared by the print tests; none of them modify it."""
+    path = tmp_path_factory.mktemp("printer") / "test.pdf"
+    path.write_text("dummy")
+    return path
+
+
+@pytest.fixture
+def fake_run(monkeypatch) -> _FakeRun:
+    """Fake runner to pass to Printer, with lpr and lpstat present."""
+    monkeypatch.setattr("cookpad.fridge.printer._LPR", "/usr/bin/lpr")
+    monkeypatch.setattr("cookpad.fridge.printer._LPSTAT", "/usr/bin/lpstat")
+    return _FakeRun()
 
 
 class TestListPrinters:
-    def test_list_printers_no_lpstat(self):
+    def test_list_printers_no_lpstat(self, monkeypatch):
         """Raises RuntimeError when lpstat is not available."""
-        with patch("shutil.which", return_value=None):
-            with pytest.raises(RuntimeError, match="lpstat"):
-                Printer.list_printers()
+        monkeypatch.setattr("cookpad.fridge.printer._LPSTAT", None)
+        with pytest.raises(RuntimeError, match="lpstat"):
+            Printer.list_printers()
 
-    def test_list_printers_with_printers(self):
+    def test_list_printers_with_printers(self, fake_run):
         """Returns list of printers from lpstat output."""
-        with patch("shutil.which", return_value="/usr/bin/lpstat"):
-            default_result = MagicMock()
-            default_result.returncode = 0
-            default_result.stdout = "system default destination: HP_LaserJet\n"
-
-            list_result = MagicMock()
-            list_result.returncode = 0
-            list_result.stdout = (
+        fake_run.results = [
+            _completed(0, "system default destination: HP_LaserJet\n"),
+            _completed(
+                0,
                 "printer HP_LaserJet is idle.\n"
-                "printer Brother_HL disabled since ...\n"
-            )
-
-            with patch(
-                "subprocess.run",
-                side_effect=[default_result, list_result],
-            ):
-                printers = Printer.list_printers()
+                "printer Brother_HL disabled since ...\n",
+            ),
+        ]
+        printers = Printer.list_printers(runner=fake_run)
 
         assert len(printers) == 2
         assert printers[0].name == "HP_LaserJet"
@@ -43,24 +80,10 @@ class TestListPrinters:
         assert printers[1].name == "Brother_HL"
         assert printers[1].is_default is False
 
-    def test_list_printers_empty(self):
+    def test_list_printers_empty(self, fake_run):
         """Returns empty list when no printers found."""
-        with patch("shutil.which", return_value="/usr/bin/lpstat"):
-            default_result = MagicMock()
-            default_result.returncode = 1
-            default_result.stdout = ""
-
-            list_result = MagicMock()
-            list_result.returncode = 0
-            list_result.stdout = ""
-
-            with patch(
-                "subprocess.run",
-                side_effect=[default_result, list_result],
-            ):
-                printers = Printer.list_printers()
-
-        assert printers == []
+        fake_run.results = [_completed(1), _completed(0)]
+        assert Printer.list_printers(runner=fake_run) == []
 
 
 class TestPrintFile:
@@ -69,72 +92,109 @@ class TestPrintFile:
         with pytest.raises(FileNotFoundError, match="ファイルが見つかりません"):
             Printer.print_file("/nonexistent/file.pdf")
 
-    def test_print_file_no_lpr(self, tmp_path):
+    def test_print_file_no_lpr(self, pdf_file, monkeypatch):
         """Raises RuntimeError when lpr is not available."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-
-        with patch("shutil.which", return_value=None):
-            with pytest.raises(RuntimeError, match="lpr"):
-                Printer.print_file(pdf_file)
+        monkeypatch.setattr("cookpad.fridge.printer._LPR", None)
+        with pytest.raises(RuntimeError, match="lpr"):
+            Printer.print_file(pdf_file)
 
-    def test_print_file_default_printer(self, tmp_path):
+    def test_print_file_default_printer(self, pdf_file, fake_run):
         """Prints to default printer when no printer_name given."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
+        Printer.print_file(pdf_file, runner=fake_run)
 
-        result = MagicMock()
-        result.returncode = 0
-
-        with patch("shutil.which", return_value="/usr/bin/lpr"):
-            with patch("subprocess.run", return_value=result) as mock_run:
-                Printer.print_file(pdf_file)
-
-        mock_run.assert_called_once()
-        cmd = mock_run.call_args[0][0]
-        assert cmd[0] == "lpr"
+        assert len(fake_run.calls) == 1
+        cmd = fake_run.calls[0]
+        assert cmd[0] == "/usr/bin/lpr"
         assert "-P" not in cmd
         assert str(pdf_file) in cmd
 
-    def test_print_file_named_printer(self, tmp_path):
+    def test_print_file_named_printer(self, pdf_file, fake_run):
         """Prints to specific printer when printer_name given."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-
-        result = MagicMock()
-        result.returncode = 0
+        Printer.print_file(pdf_file, printer_name="Brother_HL", runner=fake_run)
 
-        with patch("shutil.which", return_value="/usr/bin/lpr"):
-            with patch("subprocess.run", return_value=result) as mock_run:
-                Printer.print_file(pdf_file, printer_name="Brother_HL")
-
-        cmd = mock_run.call_args[0][0]
+        cmd = fake_run.calls[0]
         assert "-P" in cmd
         assert "Brother_HL" in cmd
 
-    def test_print_file_failure(self, tmp_path):
+    def test_print_file_failure(self, pdf_file, fake_run):
         """Raises RuntimeError when lpr returns error."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
+        fake_run.results = [_completed(1, stderr="No printer found")]
+        with pytest.raises(RuntimeError, match="印刷に失敗"):
+            Printer.print_file(pdf_file, runner=fake_run)
+
+    def test_print_file_timeout(self, pdf_file, fake_run):
+        """Raises RuntimeError on timeout."""
+        fake_run.results = [subprocess.TimeoutExpired(cmd="lpr", timeout=30)]
+        with pytest.raises(RuntimeError, match="タイムアウト"):
+            Printer.print_file(pdf_file, runner=fake_run)
 
-        result = MagicMock()
-        result.returncode = 1
-        result.stderr = "No printer found"
 
-        with patch("shutil.which", return_value="/usr/bin/lpr"):
-            with patch("subprocess.run", return_value=result):
-                with pytest.raises(RuntimeError, match="印刷に失敗"):
-                    Printer.print_file(pdf_file)
+class TestCupsBackend:
+    def test_runner_bypasses_cups(self, pdf_file, fake_run):
+        """An injected runner always takes the lpr path, even with CUPS up."""
+        conn = MagicMock()
 
-    def test_print_file_timeout(self, tmp_path):
-        """Raises RuntimeError on timeout."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-
-        with patch("shutil.which", return_value="/usr/bin/lpr"):
-            with patch(
-                "subprocess.run",
-                side_effect=subprocess.TimeoutExpired(cmd="lpr", timeout=30),
-            ):
-                with pytest.raises(RuntimeError, match="タイムアウト"):
-                    Printer.print_file(pdf_file)
+        with patch("cookpad.fridge.printer._cups_connection", return_value=conn):
+            Printer.print_file(pdf_file, runner=fake_run)
+
+        conn.printFile.assert_not_called()
+        assert fake_run.calls[0][0] == "/usr/bin/lpr"
+
+    def test_list_printers_via_cups(self):
+        """Lists printers from the CUPS connection without spawning lpstat."""
+        conn = MagicMock()
+        conn.getPrinters.return_value = {"HP_LaserJet": {}, "Brother_HL": {}}
+        conn.getDefault.return_value = "Brother_HL"
+
+        with patch("cookpad.fridge.printer._cups_connection", return_value=conn):
+            with patch("subprocess.run") as mock_run:
+                printers = Printer.list_printers()
+
+        mock_run.assert_not_called()
+        assert printers == [
+            PrinterInfo(name="HP_LaserJet", is_default=False),
+            PrinterInfo(name="Brother_HL", is_default=True),
+        ]
+
+    def test_print_file_via_cups(self, pdf_file):
+        """Submits the job to the default CUPS printer."""
+        conn = MagicMock()
+        conn.getDefault.return_value = "HP_LaserJet"
+
+        with patch("cookpad.fridge.printer._cups_connection", return_value=conn):
+            with patch("subprocess.run") as mock_run:
+                Printer.print_file(pdf_file)
+
+        mock_run.assert_not_called()
+        conn.printFile.assert_called_once_with(
+            "HP_LaserJet", str(pdf_file), "cookpad", {}
+        )
+
+    def test_print_file_via_cups_failure(self, pdf_file):
+        """CUPS errors surface as RuntimeError."""
+        conn = MagicMock()
+        conn.printFile.side_effect = Exception("client-error-not-found")
+
+        with patch("cookpad.fridge.printer._cups_connection", return_value=conn):
+            with pytest.raises(RuntimeError, match="印刷に失敗"):
+                Printer.print_file(pdf_file, printer_name="Brother_HL")
+
+    def test_failed_cups_call_drops_cached_connection(self, pdf_file, monkeypatch):
+        """After a CUPS error the next call opens a fresh connection."""
+        from cookpad.fridge import printer
+
+        dead, fresh = MagicMock(), MagicMock()
+        dead.printFile.side_effect = Exception("server-error")
+        fresh.getDefault.return_value = "HP_LaserJet"
+        cups = MagicMock()
+        cups.Connection.side_effect = [dead, fresh]
+        monkeypatch.setitem(sys.modules, "cups", cups)
+        # Undo the autouse opt-out; the import above is the real function
+        monkeypatch.setattr(printer, "_cups_connection", _cups_connection)
+        monkeypatch.setattr(printer, "_local", threading.local())
+
+        with pytest.raises(RuntimeError, match="印刷に失敗"):
+            Printer.print_file(pdf_file, printer_name="HP_LaserJet")
+        Printer.print_file(pdf_file)
+
+        fresh.printFile.assert_called_once()
@@ -1,63 +1,106 @@
 """Tests for MealPlanScheduler."""
 
+import asyncio
+
 import pytest
 
-from cookpad.fridge.config import FridgeConfig, IAEONConfig, load_config
-
-
-def test_scheduler_import_error():
-    """MealPlanScheduler raises ImportError if apscheduler is missing."""
-    # This test verifies behavior whether or not apscheduler is installed
-    try:
-        from cookpad.fridge.scheduler import MealPlanScheduler
-
-        # If import succeeds, apscheduler is installed
-        config = load_config()
-        scheduler = MealPlanScheduler(config)
-        assert scheduler is not None
-        assert scheduler.running is False
-    except ImportError:
-        # Expected if apscheduler is not installed
-        pass
-
-
-def test_scheduler_setup_jobs():
-    """Scheduler registers jobs when iaeon is enabled."""
-    try:
-        from cookpad.fridge.scheduler import MealPlanScheduler
-
-        config = load_config()
-        config.iaeon.enabled = True
-        config.iaeon.fetch_schedule = "0 8 * * *"
-        config.iaeon.plan_schedule = "0 6 * * *"
-
-        scheduler = MealPlanScheduler(config)
-        scheduler.setup_jobs()
-
-        jobs = scheduler.get_jobs()
-        job_ids = {j["id"] for j in jobs}
-        assert "fetch_receipts" in job_ids
-        assert "generate_plan" in job_ids
-        assert "expire_items" in job_ids
-    except ImportError:
-        pytest.skip("apscheduler not installed")
-
-
-def test_scheduler_expire_job_always_registered():
-    """expire_items job is always registered."""
-    try:
-        from cookpad.fridge.scheduler import MealPlanScheduler
-
-        config = load_config()
-        config.iaeon.enabled = False
-
-        scheduler = MealPlanScheduler(config)
-        scheduler.setup_jobs()
-
-        jobs = scheduler.get_jobs()
-        job_ids = {j["id"] for j in jobs}
-        assert "expire_items" in job_ids
-        # iaeon jobs should not be registered
-        assert "fetch_receipts" not in job_ids
-    except ImportError:
-        pytest.skip("apscheduler not installed")
+from cookpad.fridge.config import FridgeConfig, IAEONConfig
+
+pytest.importorskip("apscheduler")
+
+from cookpad.fridge.scheduler import MealPlanScheduler  # noqa: E402
+
+
+def test_scheduler_not_running_after_init(config):
+    """A new MealPlanScheduler is created stopped."""
+    scheduler = MealPlanScheduler(config)
+    assert scheduler is not None
+    assert scheduler.running is False
+
+
+@pytest.mark.parametrize(
+    "iaeon_enabled,registered,not_registered",
+    [
+        (True, {"fetch_receipts", "generate_plan", "expire_items"}, set()),
+        # expire_items is always registered; iaeon jobs only when enabled
+        (False, {"expire_items"}, {"fetch_receipts", "generate_plan"}),
+    ],
+)
+def test_scheduler_setup_jobs(config, iaeon_enabled, registered, not_registered):
+    """Scheduler registers the iaeon jobs only when iaeon is enabled."""
+    config.iaeon.enabled = iaeon_enabled
+    config.iaeon.fetch_schedule = "0 8 * * *"
+    config.iaeon.plan_schedule = "0 6 * * *"
+
+    scheduler = MealPlanScheduler(config)
+    scheduler.setup_jobs()
+
+    job_ids = {j["id"] for j in scheduler.get_jobs()}
+    assert registered <= job_ids
+    assert not job_ids & not_registered
+
+
+async def test_scheduler_jobs_share_db_connection(config, tmp_path):
+    """Jobs reuse one inventory connection until the scheduler stops."""
+    config.database.path = str(tmp_path / "inventory.db")
+
+    scheduler = MealPlanScheduler(config)
+    await scheduler._job_expire_items()
+    conn = scheduler._inventory_db._conn
+    await scheduler._job_expire_items()
+
+    assert conn is not None
+    assert scheduler._inventory_db._conn is conn
+
+    scheduler.stop()
+    assert scheduler._inventory_db._conn is None
+
+
+def test_scheduler_coalesces_adjacent_fetch_and_plan(config):
+    """A plan scheduled right after the fetch runs as a single job."""
+    config.iaeon.enabled = True
+    config.iaeon.fetch_schedule = "0 8 * * *"
+    config.iaeon.plan_schedule = "3 8 * * *"
+
+    scheduler = MealPlanScheduler(config)
+    scheduler.setup_jobs()
+
+    assert scheduler._scheduler.get_job("fetch_then_plan") is not None
+    assert scheduler._scheduler.get_job("fetch_receipts") is None
+    assert scheduler._scheduler.get_job("generate_plan") is None
+    scheduler.stop()
+
+
+def test_scheduler_keeps_fetch_job_for_different_cadences(config):
+    """A fetch every 6 hours is not folded into a once-a-day plan."""
+    config.iaeon.enabled = True
+    config.iaeon.fetch_schedule = "0 */6 * * *"
+    config.iaeon.plan_schedule = "3 6 * * *"
+
+    scheduler = MealPlanScheduler(config)
+    scheduler.setup_jobs()
+
+    assert scheduler._scheduler.get_job("fetch_receipts") is not None
+    assert scheduler._scheduler.get_job("generate_plan") is not None
+    assert scheduler._scheduler.get_job("fetch_then_plan") is None
+    scheduler.stop()
+
+
+async def test_scheduler_plan_waits_for_running_fetch(config, monkeypatch):
+    """A separately scheduled plan starts only after an in-flight fetch."""
+    scheduler = MealPlanScheduler(config)
+    order: list[str] = []
+    monkeypatch.setattr(
+        scheduler._inventory_db,
+        "get_inventory_as_ingredients",
+        lambda: order.append("plan") or [],
+    )
+
+    async with scheduler._fetch_lock:
+        plan = asyncio.ensure_future(scheduler._job_generate_plan())
+        await asyncio.sleep(0)
+        order.append("fetch done")
+    await plan
+
+    assert order == ["fetch done", "plan"]
+    scheduler.stop()
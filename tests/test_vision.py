@@ -1,18 +1,55 @@
 """Tests for vision backends (mocked API calls)."""
 
+import base64
 import json
 import sys
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
-from cookpad.fridge.config import FridgeConfig, load_config
+from cookpad.fridge.config import FridgeConfig
 from cookpad.fridge.vision import DetectedIngredient, VisionBackend, create_backend
-from cookpad.fridge.vision.claude import ClaudeVisionBackend, _parse_response
+from cookpad.fridge.vision.claude import (
+    ClaudeVisionBackend,
+    _encode_image,
+    _parse_response,
+)
 from cookpad.fridge.vision.gemini import GeminiVisionBackend
 from cookpad.fridge.vision.gemini import _parse_response as gemini_parse_response
 
 
+# Canned model replies, encoded once at import
+_TWO_VEGETABLES_JSON = json.dumps([
+    {"name": "トマト", "confidence": 0.95, "category": "野菜"},
+    {"name": "きゅうり", "confidence": 0.8, "category": "野菜"},
+])
+_SHELF_RESPONSES_JSON = (
+    json.dumps([{"name": "トマト", "confidence": 0.6, "category": "野菜"}]),
+    json.dumps([
+        {"name": "トマト", "confidence": 0.9, "category": "野菜"},
+        {"name": "牛乳", "confidence": 0.8, "category": "乳製品"},
+    ]),
+)
+
+# Stand-in for the anthropic SDK, which ClaudeVisionBackend imports lazily
+_ANTHROPIC = MagicMock()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_anthropic():
+    with patch.dict(sys.modules, {"anthropic": _ANTHROPIC}):
+        yield
+
+
+@pytest.fixture
+def anthropic_client() -> AsyncMock:
+    """Fresh mock client handed out by the stubbed ``AsyncAnthropic``."""
+    _ANTHROPIC.reset_mock()
+    client = AsyncMock()
+    _ANTHROPIC.AsyncAnthropic.return_value = client
+    return client
+
+
 class TestDetectedIngredient:
     def test_dataclass(self):
         ing = DetectedIngredient(name="トマト", confidence=0.9, category="野菜")
@@ -22,114 +59,243 @@ class TestDetectedIngredient:
 
 
 class TestCreateBackend:
-    def test_create_claude_backend(self):
-        config = load_config()
+    def test_create_claude_backend(self, config):
         backend = create_backend(config)
         assert isinstance(backend, ClaudeVisionBackend)
 
-    def test_create_gemini_backend(self):
-        config = load_config()
+    def test_create_gemini_backend(self, config):
         config.vision.backend = "gemini"
         backend = create_backend(config)
         assert isinstance(backend, GeminiVisionBackend)
 
-    def test_create_unknown_backend(self):
-        config = load_config()
+    def test_create_unknown_backend(self, config):
         config.vision.backend = "unknown"
         with pytest.raises(ValueError, match="不明なVisionバックエンド"):
             create_backend(config)
 
 
-class TestClaudeParseResponse:
-    def test_parse_json_array(self):
-        text = json.dumps([
-            {"name": "トマト", "confidence": 0.95, "category": "野菜"},
-            {"name": "鶏肉", "confidence": 0.8, "category": "肉"},
-        ])
-        result = _parse_response(text)
-        assert len(result) == 2
-        assert result[0].name == "トマト"
-        assert result[1].name == "鶏肉"
-
-    def test_parse_with_markdown_fences(self):
-        text = """```json
+@pytest.mark.parametrize(
+    "parse,text,expected",
+    [
+        pytest.param(
+            _parse_response,
+            json.dumps([
+                {"name": "トマト", "confidence": 0.95, "category": "野菜"},
+                {"name": "鶏肉", "confidence": 0.8, "category": "肉"},
+            ]),
+            [("トマト", 0.95, "野菜"), ("鶏肉", 0.8, "肉")],
+            id="claude-json-array",
+        ),
+        pytest.param(
+            _parse_response,
+            """```json
 [
   {"name": "卵", "confidence": 0.9, "category": "卵"},
   {"name": "牛乳", "confidence": 0.7, "category": "乳製品"}
 ]
-```"""
-        result = _parse_response(text)
-        assert len(result) == 2
-        assert result[0].name == "卵"
-
-    def test_parse_deduplicates_by_name(self):
-        text = json.dumps([
-            {"name": "トマト", "confidence": 0.6, "category": "野菜"},
-            {"name": "トマト", "confidence": 0.9, "category": "野菜"},
-        ])
-        result = _parse_response(text)
-        assert len(result) == 1
-        assert result[0].confidence == 0.9
-
-    def test_parse_default_category(self):
-        text = json.dumps([
-            {"name": "何か", "confidence": 0.5},
-        ])
-        result = _parse_response(text)
-        assert result[0].category == "その他"
-
-
-class TestGeminiParseResponse:
-    def test_parse_json_array(self):
-        text = json.dumps([
-            {"name": "にんじん", "confidence": 0.85, "category": "野菜"},
-        ])
-        result = gemini_parse_response(text)
-        assert len(result) == 1
-        assert result[0].name == "にんじん"
+```""",
+            [("卵", 0.9, "卵"), ("牛乳", 0.7, "乳製品")],
+            id="claude-markdown-fences",
+        ),
+        pytest.param(
+            _parse_response,
+            json.dumps([
+                {"name": "トマト", "confidence": 0.6, "category": "野菜"},
+                {"name": "トマト", "confidence": 0.9, "category": "野菜"},
+            ]),
+            [("トマト", 0.9, "野菜")],
+            id="claude-deduplicates-by-name",
+        ),
+        pytest.param(
+            _parse_response,
+            json.dumps([{"name": "何か", "confidence": 0.5}]),
+            [("何か", 0.5, "その他")],
+            id="claude-default-category",
+        ),
+        pytest.param(
+            gemini_parse_response,
+            json.dumps([
+                {"name": "にんじん", "confidence": 0.85, "category": "野菜"},
+            ]),
+            [("にんじん", 0.85, "野菜")],
+            id="gemini-json-array",
+        ),
+    ],
+)
+def test_parse_response(parse, text, expected):
+    result = parse(text)
+    assert [(r.name, r.confidence, r.category) for r in result] == expected
 
 
 class TestClaudeVisionBackend:
-    @pytest.mark.asyncio
     async def test_detect_requires_api_key(self):
         backend = ClaudeVisionBackend(api_key="")
         with pytest.raises(ValueError, match="APIキー"):
             await backend.detect_ingredients(["/tmp/test.jpg"])
 
-    @pytest.mark.asyncio
-    async def test_detect_ingredients_mocked(self, tmp_path):
+    async def test_detect_ingredients_mocked(self, tmp_path, anthropic_client):
         """Test Claude backend with mocked API call."""
         # Create a fake image file
         img = tmp_path / "test.jpg"
         img.write_bytes(b"\xff\xd8\xff\xe0fake-jpeg")
 
         mock_response = MagicMock()
-        mock_response.content = [
-            MagicMock(
-                text=json.dumps([
-                    {"name": "トマト", "confidence": 0.95, "category": "野菜"},
-                    {"name": "きゅうり", "confidence": 0.8, "category": "野菜"},
-                ])
-            )
-        ]
-
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
+        mock_response.content = [MagicMock(text=_TWO_VEGETABLES_JSON)]
 
-        mock_anthropic = MagicMock()
-        mock_anthropic.AsyncAnthropic.return_value = mock_client
+        anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
-        with patch.dict(sys.modules, {"anthropic": mock_anthropic}):
-            backend = ClaudeVisionBackend(api_key="test-key")
-            result = await backend.detect_ingredients([str(img)])
+        backend = ClaudeVisionBackend(api_key="test-key")
+        result = await backend.detect_ingredients([str(img)])
 
         assert len(result) == 2
         assert result[0].name == "トマト"
 
+    async def test_detect_ingredients_one_request_per_image(
+        self, tmp_path, anthropic_client
+    ):
+        """Each image gets its own request; duplicates keep max confidence."""
+        images = []
+        for i in range(2):
+            img = tmp_path / f"shelf{i}.jpg"
+            img.write_bytes(b"\xff\xd8\xff\xe0fake-jpeg")
+            images.append(str(img))
+
+        anthropic_client.messages.create = AsyncMock(
+            side_effect=[
+                MagicMock(content=[MagicMock(text=text)])
+                for text in _SHELF_RESPONSES_JSON
+            ]
+        )
+
+        backend = ClaudeVisionBackend(api_key="test-key")
+        result = await backend.detect_ingredients(images)
+
+        assert anthropic_client.messages.create.await_count == 2
+        by_name = {r.name: r.confidence for r in result}
+        assert by_name == {"トマト": 0.9, "牛乳": 0.8}
+
+    async def test_client_reused_across_calls(self, tmp_path, anthropic_client):
+        img = tmp_path / "test.jpg"
+        img.write_bytes(b"\xff\xd8\xff\xe0fake-jpeg")
+
+        anthropic_client.messages.create = AsyncMock(
+            return_value=MagicMock(content=[MagicMock(text="[]")])
+        )
+
+        backend = ClaudeVisionBackend(api_key="test-key")
+        await backend.detect_ingredients([str(img)])
+        await backend.detect_ingredients([str(img)])
+        await backend.aclose()
+
+        _ANTHROPIC.AsyncAnthropic.assert_called_once()
+        anthropic_client.close.assert_awaited_once()
+
+    def test_encode_image_matches_b64encode(self, tmp_path):
+        img = tmp_path / "test.jpg"
+        img.write_bytes(b"\xff\xd8\xff\xe0fake-jpeg")
+        empty = tmp_path / "empty.jpg"
+        empty.write_bytes(b"")
+
+        assert _encode_image(str(img)) == base64.standard_b64encode(
+            img.read_bytes()
+        ).decode()
+        assert _encode_image(str(empty)) == ""
+
 
 class TestGeminiVisionBackend:
-    @pytest.mark.asyncio
     async def test_detect_requires_api_key(self):
         backend = GeminiVisionBackend(api_key="")
         with pytest.raises(ValueError, match="APIキー"):
             await backend.detect_ingredients(["/tmp/test.jpg"])
+
+
+class TestAIHatPostprocess:
+    def test_keeps_max_confidence_per_class(self):
+        np = pytest.importorskip("numpy")
+        from cookpad.fridge.vision import ai_hat
+
+        # COCO class IDs: 46 banana, 47 apple, 0 person (not food), 99 unknown
+        detections = np.array([
+            [0, 0, 1, 1, 0.4, 47],
+            [0, 0, 1, 1, 0.9, 47],
+            [0, 0, 1, 1, 0.7, 46],
+            [0, 0, 1, 1, 0.8, 0],
+            [0, 0, 1, 1, 0.8, 99],
+        ])
+        result = ai_hat._to_ingredients(detections)
+
+        assert [(r.name, r.confidence) for r in result] == [
+            ("バナナ", pytest.approx(0.7)),
+            ("りんご", pytest.approx(0.9)),
+        ]
+
+    def test_empty_output(self):
+        np = pytest.importorskip("numpy")
+        from cookpad.fridge.vision import ai_hat
+
+        assert ai_hat._to_ingredients(np.zeros((0, 6))) == []
+
+    async def test_device_configured_once_across_calls(self):
+        from cookpad.fridge.vision.ai_hat import AIHatVisionBackend
+
+        hailo = MagicMock()
+        input_info = MagicMock(shape=(1, 640, 640, 3))
+        input_info.name = "input"
+        hailo.HEF.return_value.get_input_vstream_infos.return_value = [input_info]
+        cv2 = MagicMock()
+        cv2.imread.return_value = None
+
+        with patch.dict(sys.modules, {"hailo_platform": hailo, "cv2": cv2}):
+            backend = AIHatVisionBackend(model_path="model.hef")
+            await backend.detect_ingredients(["a.jpg"])
+            await backend.detect_ingredients(["b.jpg"])
+            backend.close()
+
+        hailo.VDevice.assert_called_once()
+        hailo.VDevice.return_value.release.assert_called_once()
+
+    async def test_opencv_thread_count_restored_after_decode(self):
+        from cookpad.fridge.vision.ai_hat import AIHatVisionBackend
+
+        hailo = MagicMock()
+        input_info = MagicMock(shape=(1, 640, 640, 3))
+        input_info.name = "input"
+        hailo.HEF.return_value.get_input_vstream_infos.return_value = [input_info]
+        cv2 = MagicMock()
+        cv2.getNumThreads.return_value = 4
+        cv2.imread.return_value = None
+
+        with patch.dict(sys.modules, {"hailo_platform": hailo, "cv2": cv2}):
+            backend = AIHatVisionBackend(model_path="model.hef")
+            await backend.detect_ingredients(["a.jpg"])
+
+        assert cv2.setNumThreads.call_args_list == [call(1), call(4)]
+
+    async def test_images_inferred_as_one_batch(self):
+        np = pytest.importorskip("numpy")
+        from cookpad.fridge.vision import ai_hat
+
+        hailo = MagicMock()
+        input_info = MagicMock(shape=(1, 4, 4, 3))
+        input_info.name = "input"
+        hailo.HEF.return_value.get_input_vstream_infos.return_value = [input_info]
+        pipeline = hailo.InferVStreams.return_value.__enter__.return_value
+        pipeline.infer.return_value = {
+            "out": np.array([
+                [[0, 0, 1, 1, 0.6, 47]],
+                [[0, 0, 1, 1, 0.9, 47]],
+            ])
+        }
+        cv2 = MagicMock()
+        cv2.resize.return_value = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        with patch.dict(sys.modules, {"hailo_platform": hailo, "cv2": cv2}):
+            backend = ai_hat.AIHatVisionBackend(model_path="model.hef")
+            result = await backend.detect_ingredients(["a.jpg", "b.jpg"])
+
+        pipeline.infer.assert_called_once()
+        (batch,) = pipeline.infer.call_args[0][0].values()
+        assert batch.shape == (2, 4, 4, 3)
+        assert [(r.name, r.confidence) for r in result] == [
+            ("りんご", pytest.approx(0.9))
+        ]